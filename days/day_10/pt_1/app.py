@@ -108,11 +108,28 @@ adapter and count the joltage differences between the charging outlet, the adapt
 What is the number of 1-jolt differences multiplied by the number of 3-jolt differences?
 """
 from collections import Counter
-from typing import List
+from typing import Iterable, List
+
+
+def counting_sort(ratings: Iterable[int]) -> List[int]:
+    # ratings are small, so counting them up beats comparing them
+    counts = []
+    for rating in ratings:
+        if rating < 0:
+            raise ValueError(f"Joltage ratings can't be negative, got {rating}")
+        if rating >= len(counts):
+            counts.extend([0] * (rating + 1 - len(counts)))
+        counts[rating] += 1
+
+    sorted_ratings = []
+    for rating, count in enumerate(counts):
+        if count:
+            sorted_ratings.extend([rating] * count)
+    return sorted_ratings
 
 
 def clean_input(input_: str) -> List[int]:
-    return sorted([int(v) for v in input_.splitlines()])
+    return counting_sort(int(v) for v in input_.splitlines())
 
 
 def main(input_: str):
@@ -123,8 +140,7 @@ def main(input_: str):
     charging_outlet_rating = 0
     current_adapter = charging_outlet_rating
 
-    while adapters:
-        adapter = adapters.pop(0)
+    for adapter in adapters:
         differences[adapter-current_adapter] += 1
         current_adapter = adapter
 
@@ -174,42 +174,84 @@ Surely, there must be an efficient way to count the arrangements.
 What is the total number of distinct ways you can arrange the adapters to connect the charging outlet to
 your device?
 """
-from collections import Counter
-from typing import List
+from collections import Counter, deque
+from typing import Iterable, List, Optional, Tuple
 
-adapters = []
+
+def counting_sort(ratings: Iterable[int]) -> List[int]:
+    # ratings are small, so counting them up beats comparing them
+    counts = []
+    for rating in ratings:
+        if rating < 0:
+            raise ValueError(f"Joltage ratings can't be negative, got {rating}")
+        if rating >= len(counts):
+            counts.extend([0] * (rating + 1 - len(counts)))
+        counts[rating] += 1
+
+    sorted_ratings = []
+    for rating, count in enumerate(counts):
+        if count:
+            sorted_ratings.extend([rating] * count)
+    return sorted_ratings
 
 
 def clean_input(input_: str) -> List[int]:
-    return sorted([int(v) for v in input_.splitlines()])
+    return counting_sort(int(v) for v in input_.splitlines())
+
+
+def multiply_all(values: List[int]) -> int:
+    # multiplying in pairs keeps both sides of each big int multiplication about the same size
+    while len(values) > 1:
+        values = [values[i] * values[i+1] if i+1 < len(values) else values[i] for i in range(0, len(values), 2)]
+    return values[0] if values else 1
+
+
+def chain_stats(adapters: List[int], max_gap: int = 3, modulus: Optional[int] = None) -> Tuple[Counter, int]:
+    # the joltage differences along the whole chain, and the ways to arrange it. The ways to reach
+    # each rating from the outlet only ever need the last max_gap adapters, since distinct ratings
+    # further back are out of reach
+    if max_gap < 1:
+        raise ValueError(f"max_gap has to be at least 1, got {max_gap}")
+    if modulus is not None and modulus < 1:
+        raise ValueError(f"modulus has to be at least 1, got {modulus}")
+
+    differences = Counter()
+    window = deque([(0, 1)], maxlen=max_gap)
+    # a gap of exactly max_gap has to be taken, so the runs between those gaps can be counted
+    # separately and multiplied at the end, rather than carrying one huge count along the chain
+    run_counts = []
 
+    for adapter in adapters:
+        previous = window[-1][0]
+        if adapter == previous:
+            raise ValueError(f"Adapter ratings have to be distinct, {adapter} is repeated")
+        differences[adapter - previous] += 1
 
-def cache_counts(f):
-    counts = Counter()
+        if modulus is None and adapter - previous == max_gap:
+            run_counts.append(window[-1][1])
+            window.clear()
+            window.append((previous, 1))
 
-    def inner(rating, adapter_idx):
-        if not counts[rating]:
-            counts[rating] = f(rating, adapter_idx)
+        ways = sum(count for rating, count in window if adapter - rating <= max_gap)
+        if modulus is not None:
+            ways %= modulus
+        window.append((adapter, ways))
 
-        return counts[rating]
-    return inner
+    # the device is always max_gap above the last adapter, so there's only one way on from there
+    differences[max_gap] += 1
+    run_counts.append(window[-1][1])
 
+    if modulus is not None:
+        # with no adapters the starting count was never reduced
+        return differences, run_counts[0] % modulus
+    return differences, multiply_all(run_counts)
 
-@cache_counts
-def calc_distinct_adapters(rating, adapter_idx: int = 0):
-    count = 0
-    for ind, adapter in enumerate(adapters[adapter_idx:]):
-        if adapter-rating > 3:
-            break
 
-        count += calc_distinct_adapters(rating=adapter, adapter_idx=adapter_idx+ind+1)
-    else:
-        return 1
-    return count
+def count_arrangements(adapters: List[int], max_gap: int = 3, modulus: Optional[int] = None) -> int:
+    return chain_stats(adapters, max_gap=max_gap, modulus=modulus)[1]
 
 
 def main():
-    global adapters
     adapters = clean_input("""30
 73
 84
@@ -310,9 +352,8 @@ def main():
 76
 103
 122""")
-    adapters.append(adapters[-1]+3)
 
-    return calc_distinct_adapters(rating=0, adapter_idx=0)
+    return count_arrangements(adapters)
 
 
 if __name__ == '__main__':
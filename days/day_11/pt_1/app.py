@@ -123,6 +123,8 @@ from dataclasses import dataclass
 from functools import lru_cache
 from typing import List, Tuple
 
+import numpy as np
+
 
 @dataclass
 class SeatStatus:
@@ -185,6 +187,40 @@ def update_layout(
     return new_layout, SeatStatus(seats_changed=seats_changed, seat_counter=seat_counter)
 
 
+def create_grid(layout: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    # a mask of where the seats are, and which of them are occupied
+    grid = np.frombuffer("".join(layout).encode("ascii"), dtype=np.uint8).reshape(len(layout), -1)
+    return grid != ord("."), (grid == ord("#")).astype(np.uint8)
+
+
+def count_neighbours(occupied: np.ndarray) -> np.ndarray:
+    padded = np.pad(occupied, 1)
+    rows, cols = occupied.shape
+
+    neighbours = np.zeros_like(occupied)
+    for d_row in (0, 1, 2):
+        for d_col in (0, 1, 2):
+            if (d_row, d_col) != (1, 1):
+                neighbours += padded[d_row:d_row+rows, d_col:d_col+cols]
+    return neighbours
+
+
+def update_grid(seats: np.ndarray, occupied: np.ndarray, tolerance: int = 4) -> np.ndarray:
+    neighbours = count_neighbours(occupied)
+    stays_or_becomes_occupied = np.where(occupied == 1, neighbours < tolerance, neighbours == 0)
+    return (seats & stays_or_becomes_occupied).astype(np.uint8)
+
+
+def simulate(layout: List[str], tolerance: int = 4) -> int:
+    seats, occupied = create_grid(layout)
+
+    while True:
+        next_occupied = update_grid(seats, occupied, tolerance=tolerance)
+        if np.array_equal(next_occupied, occupied):
+            return int(occupied.sum())
+        occupied = next_occupied
+
+
 def main():
     layout = """LLLLLL.LLLLL.LLLL..LLLLLLLLL.LLLLLLLLLLLLLLLLL.LLLLLLL.LLLLL..LLLLLLLLLLLLLLLLLLLL.LLLLLL.LLLLLLL
 LLLLLL.LLLLL.LLLLL.LLLLLLLLL.LLLLLLLLL.LLLLLLL.LLLLLLLLLLLLLL.LLLLLLLLLLLLLL.LLLLL.LLLLLL.LLLLLLL
@@ -284,13 +320,7 @@ LLLLLL.LLLLL.LLLLL.LLLLLLLLLLLLLLLLLLL.LLLLLLL.L.LLLLLLLLLLLLLLLLLLLLLLLLLLL.LLL
 LLLLLL.LL.LLLLLLLLLLLLLLLLLL.LLLLLLLLL.LLLLLLLLLLLLLLL.LLLLLL.LLLLL.LLLLLLLL.LLLLLLLLLLLL.LLLLLLL
 LLLLL.LLLLLL.LLLLL.LLLLLLLLL.LLLLLLLLL.LLLLLLL.LLLLLLL.LLLLLL.LLLLL.LLLLLLLL.LLLLL.LLLLLL.LLLLLLL""".splitlines()
 
-    shape = len(layout), len(layout[0])
-    while True:
-        print("\n".join(layout))
-        print("\n", "="*20, "\n")
-        layout, seat_status = update_layout(layout, shape=shape)
-        if not seat_status.seats_changed:
-            return seat_status.seat_counter["#"]
+    return simulate(layout)
 
 
 if __name__ == '__main__':
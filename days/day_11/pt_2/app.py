@@ -260,6 +260,8 @@ from collections import Counter
 from dataclasses import dataclass
 from typing import List, Tuple
 
+import numpy as np
+
 from utils import timeit
 
 
@@ -333,6 +335,67 @@ def update_layout(
     return new_layout, SeatStatus(seats_changed=seats_changed, seat_counter=seat_counter)
 
 
+def create_grid(layout: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    # a mask of where the seats are, and which of them are occupied
+    grid = np.frombuffer("".join(layout).encode("ascii"), dtype=np.uint8).reshape(len(layout), -1)
+    return grid != ord("."), (grid == ord("#")).astype(np.uint8)
+
+
+def nearest_seat(seat_ids: np.ndarray, direction: Tuple[int, int]) -> np.ndarray:
+    # the id of the first seat seen from every cell looking in direction, or -1 if there isn't one
+    d_row, d_col = direction
+    if d_row == 0:
+        return nearest_seat(seat_ids.T, (d_col, d_row)).T
+    if d_row == 1:
+        return nearest_seat(seat_ids[::-1], (-1, d_col))[::-1]
+
+    # looking up, row by row from the top. Whatever is seen from a cell in the row above is
+    # either the seat in that cell, or whatever that cell sees itself
+    rows, cols = seat_ids.shape
+    nearest = np.full(seat_ids.shape, -1, dtype=np.int32)
+    for row in range(1, rows):
+        seen = np.where(seat_ids[row-1] != -1, seat_ids[row-1], nearest[row-1])
+        if d_col == 0:
+            nearest[row] = seen
+        elif d_col == -1:
+            nearest[row, 1:] = seen[:-1]
+        else:
+            nearest[row, :-1] = seen[1:]
+
+    return nearest
+
+
+def visible_neighbours(seats: np.ndarray) -> np.ndarray:
+    # (n_seats, 8) of the seat ids visible in each direction, with -1 for none. Floor never
+    # changes, so this only has to be worked out once per layout
+    n_seats = int(seats.sum())
+    seat_ids = np.full(seats.shape, -1, dtype=np.int32)
+    seat_ids[seats] = np.arange(n_seats, dtype=np.int32)
+
+    neighbours = np.empty((n_seats, len(directions)), dtype=np.int32)
+    for idx, direction in enumerate(directions):
+        neighbours[:, idx] = nearest_seat(seat_ids, direction)[seats]
+    return neighbours
+
+
+def update_seats(occupied: np.ndarray, neighbours: np.ndarray, tolerance: int = 5) -> np.ndarray:
+    # the extra empty seat on the end is what the -1s in neighbours index
+    occupied_count = np.append(occupied, 0)[neighbours].sum(axis=1)
+    return np.where(occupied == 1, occupied_count < tolerance, occupied_count == 0).astype(np.uint8)
+
+
+def simulate(layout: List[str], tolerance: int = 5) -> int:
+    seats, occupied = create_grid(layout)
+    neighbours = visible_neighbours(seats)
+    occupied = occupied[seats]
+
+    while True:
+        next_occupied = update_seats(occupied, neighbours, tolerance=tolerance)
+        if np.array_equal(next_occupied, occupied):
+            return int(occupied.sum())
+        occupied = next_occupied
+
+
 @timeit(iterations=10)
 def main():
     layout = """L.LL.LL.LL
@@ -346,11 +409,7 @@ LLLLLLLLLL
 L.LLLLLL.L
 L.LLLLL.LL""".splitlines()
 
-    shape = len(layout), len(layout[0])
-    while True:
-        layout, seat_status = update_layout(layout, shape=shape)
-        if not seat_status.seats_changed:
-            return seat_status.seat_counter["#"]
+    return simulate(layout)
 
 
 if __name__ == '__main__':
@@ -56,10 +56,15 @@ As a sanity check, look through your list of boarding passes.
 What is the highest seat ID on a boarding pass?
 """
 from enum import Enum
-from typing import Generator
+from typing import Generator, List
+
+import numpy as np
 
 n_rows, n_cols = range(128), range(8)
 
+# F/L select the lower half and B/R the upper, so a pass is just a 10 bit binary number
+seat_table = str.maketrans("FBLR", "0101")
+
 
 class Region(str, Enum):
     upper = "U"
@@ -112,8 +117,36 @@ def calc_seats(space_partitions: str):
     return (calc_seat(sp) for sp in space_partitions)
 
 
+def decode_seat(space_partition: str) -> int:
+    return int(space_partition.translate(seat_table), 2)
+
+
+def decode_seats(space_partitions: List[str]) -> np.ndarray:
+    n_bits = len(n_rows).bit_length() - 1 + len(n_cols).bit_length() - 1
+    lengths = np.fromiter(map(len, space_partitions), dtype=np.int64, count=len(space_partitions))
+    if (lengths != n_bits).any():
+        bad = space_partitions[int(np.argmax(lengths != n_bits))]
+        raise ValueError(f"Boarding passes have to be {n_bits} characters, got {bad!r}")
+
+    passes = np.frombuffer(
+        "".join(space_partitions).encode("ascii"),
+        dtype=np.uint8
+    ).reshape(-1, n_bits)
+
+    letters = "FBLR"
+    allowed = np.zeros(256, dtype=bool)
+    allowed[np.frombuffer(letters.encode("ascii"), dtype=np.uint8)] = True
+    if not allowed[passes].all():
+        bad = space_partitions[int(np.argmin(allowed[passes].all(axis=1)))]
+        raise ValueError(f"Boarding passes can only use {letters}, got {bad!r}")
+
+    # "F" and "L" are the only ones of "FBLR" with bit 2 set
+    bits = (~passes >> 2) & 1
+    return bits.dot(1 << np.arange(n_bits - 1, -1, -1, dtype=np.int64))
+
+
 def main(input_):
-    return max(calc_seats(input_.splitlines()))
+    return int(decode_seats(input_.splitlines()).max())
 
 
 if __name__ == '__main__':
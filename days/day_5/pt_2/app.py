@@ -71,13 +71,44 @@ What is the ID of your seat?
 
 
 """
-from dataclasses import dataclass
+from array import array
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Generator
+from typing import Dict, Generator, Iterable, List
 
-import pandas as pd
+import numpy as np
 
-n_rows, n_cols = range(128), range(8)
+
+@dataclass
+class Layout:
+    row_bits: int
+    col_bits: int
+    lower: str = "FL"
+    upper: str = "BR"
+    # lower chars select the lower half and upper the upper, so a pass is just a binary number
+    table: Dict[int, int] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.table = str.maketrans(self.lower + self.upper, "0" * len(self.lower) + "1" * len(self.upper))
+
+    @property
+    def n_bits(self) -> int:
+        return self.row_bits + self.col_bits
+
+    @property
+    def rows(self) -> range:
+        return range(1 << self.row_bits)
+
+    @property
+    def cols(self) -> range:
+        return range(1 << self.col_bits)
+
+
+default_layout = Layout(row_bits=7, col_bits=3)
+
+n_rows, n_cols = default_layout.rows, default_layout.cols
+
+seat_dtype = np.dtype([("row", np.uint32), ("col", np.uint32), ("id", np.uint32)])
 
 
 @dataclass
@@ -138,17 +169,117 @@ def calc_seats(space_partitions: str):
     return [calc_seat(sp) for sp in space_partitions]
 
 
+def decode_seat(space_partition: str, layout: Layout = default_layout) -> int:
+    return int(space_partition.translate(layout.table), 2)
+
+
+def decode_seats(space_partitions: List[str], layout: Layout = default_layout) -> np.ndarray:
+    n_bits = layout.n_bits
+    lengths = np.fromiter(map(len, space_partitions), dtype=np.int64, count=len(space_partitions))
+    if (lengths != n_bits).any():
+        bad = space_partitions[int(np.argmax(lengths != n_bits))]
+        raise ValueError(f"Boarding passes have to be {n_bits} characters, got {bad!r}")
+
+    passes = np.frombuffer(
+        "".join(space_partitions).encode("ascii"),
+        dtype=np.uint8
+    ).reshape(-1, n_bits)
+
+    letters = layout.lower + layout.upper
+    allowed = np.zeros(256, dtype=bool)
+    allowed[np.frombuffer(letters.encode("ascii"), dtype=np.uint8)] = True
+    if not allowed[passes].all():
+        bad = space_partitions[int(np.argmin(allowed[passes].all(axis=1)))]
+        raise ValueError(f"Boarding passes can only use {letters}, got {bad!r}")
+
+    if (layout.lower, layout.upper) == (default_layout.lower, default_layout.upper):
+        # "F" and "L" are the only ones of "FBLR" with bit 2 set
+        bits = (~passes >> 2) & 1
+    else:
+        bits = np.isin(passes, np.frombuffer(layout.upper.encode("ascii"), dtype=np.uint8)).astype(np.uint8)
+    return bits.dot(1 << np.arange(n_bits - 1, -1, -1, dtype=np.int64))
+
+
+def decode_manifest(space_partitions: Iterable[str], layouts: Iterable[Layout]) -> array:
+    # passes from different aircraft are told apart by their length
+    tables = {}
+    for layout in layouts:
+        if layout.n_bits in tables:
+            raise ValueError(f"More than one layout uses {layout.n_bits} character boarding passes")
+        tables[layout.n_bits] = layout.table
+
+    seats = array("I")
+    for space_partition in space_partitions:
+        try:
+            table = tables[len(space_partition)]
+        except KeyError:
+            raise ValueError(f"No layout for boarding pass {space_partition!r}")
+        seats.append(int(space_partition.translate(table), 2))
+
+    return seats
+
+
+def find_missing_seats(
+        seats: Iterable[int],
+        rows: range = n_rows,
+        cols: range = n_cols
+) -> List[int]:
+    occupied = bytearray(len(rows) * len(cols))
+    for seat in seats:
+        if not 0 <= seat < len(occupied):
+            raise ValueError(f"Seat {seat} isn't on a plane with {len(occupied)} seats")
+        occupied[seat] = 1
+
+    # seats missing at the very front and back of the plane don't exist, only gaps between taken seats count
+    first, last = occupied.find(1), occupied.rfind(1)
+    if first == -1:
+        return []
+
+    missing = []
+    idx = occupied.find(0, first, last)
+    while idx != -1:
+        missing.append(idx)
+        idx = occupied.find(0, idx+1, last)
+
+    return missing
+
+
+def build_seat_index(seat_ids: Iterable[int], layout: Layout = default_layout) -> np.ndarray:
+    ids = np.sort(np.fromiter(seat_ids, dtype=np.uint32))
+
+    index = np.empty(len(ids), dtype=seat_dtype)
+    index["row"] = ids >> layout.col_bits
+    index["col"] = ids & (len(layout.cols) - 1)
+    index["id"] = ids
+    return index
+
+
+def save_seat_index(index: np.ndarray, path: str):
+    np.save(path, index, allow_pickle=False)
+
+
+def load_seat_index(path: str) -> np.ndarray:
+    return np.load(path, mmap_mode="r", allow_pickle=False)
+
+
+def occupied_seats(index: np.ndarray, row_start: int, row_stop: int) -> np.ndarray:
+    # the index is sorted by id, which also sorts it by row
+    start, stop = np.searchsorted(index["row"], [row_start, row_stop])
+    return index[start:stop]
+
+
+def free_seats(index: np.ndarray, layout: Layout = default_layout) -> np.ndarray:
+    free = np.ones(len(layout.rows) * len(layout.cols), dtype=bool)
+    free[index["id"]] = False
+    return np.flatnonzero(free)
+
+
 def main(input_):
-    # seat_df = pd.DataFrame(data=calc_seats(input_.splitlines()), columns=["row", "column", "id"])
-    # seat_df.to_pickle("./seat_df.pkl")
-    seats = calc_seats(input_.splitlines())
+    seats = decode_seats(input_.splitlines()).tolist()
     print(f"Max seat is {max(seats)}")
 
-    seats.sort()
-
-    for ind, seat in enumerate(seats):
-        if seats[ind+1] != seat+1:
-            print(f"seat is {seat+1}")
+    for seat in find_missing_seats(seats):
+        print(f"seat is {seat}")
 
 
 if __name__ == '__main__':
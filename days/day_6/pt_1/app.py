@@ -58,24 +58,48 @@ In this example, the sum of these counts is 3 + 3 + 3 + 1 + 1 = 11.
 For each group, count the number of questions to which anyone answered "yes".
 What is the sum of those counts?
 """
-from typing import List
+from typing import Generator, Iterable, Tuple
 
+letter_bits = {chr(ord("a") + i): 1 << i for i in range(26)}
+all_questions = (1 << 26) - 1
 
-def count_yaaaases(lines: List[str]):
-    group = set()
+
+def popcount(mask: int) -> int:
+    return bin(mask).count("1")
+
+
+def answer_mask(answers: str) -> int:
+    mask = 0
+    for char in answers:
+        mask |= letter_bits[char]
+    return mask
+
+
+def stream_groups(lines: Iterable[str]) -> Generator[Tuple[int, int, int], None, None]:
+    # lines can be a file handle, so they may still end with a newline
+    group_index = 0
+    any_mask, all_mask = 0, all_questions
 
     for line in lines:
+        line = line.rstrip("\n")
         if line != '':
-            group.update(line)
+            mask = answer_mask(line)
+            any_mask |= mask
+            all_mask &= mask
             continue
 
-        print(group)
-        yield len(group)
-        group = set()
+        if any_mask:
+            yield group_index, popcount(any_mask), popcount(all_mask)
+            group_index += 1
+        any_mask, all_mask = 0, all_questions
+
+    if any_mask:
+        yield group_index, popcount(any_mask), popcount(all_mask)
+
 
-    else:
-        print(group)
-        yield len(group)
+def count_yaaaases(lines: Iterable[str]):
+    for _, any_count, _ in stream_groups(lines):
+        yield any_count
 
 
 def main(input_: str):
@@ -98,39 +98,98 @@ In this example, the sum of these counts is 3 + 0 + 1 + 1 + 1 = 6.
 
 For each group, count the number of questions to which everyone answered "yes". What is the sum of those counts?
 """
-from collections import Counter
-from typing import List
+from typing import Iterable, Tuple
 
+import numpy as np
 
-def match_questions_to_people(people_in_group: int, question_count: Counter):
-    return sum([v for v in question_count.values() if v == people_in_group])
+letter_bits = {chr(ord("a") + i): 1 << i for i in range(26)}
+all_questions = (1 << 26) - 1
 
+popcount_table = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
 
-def get_groups(lines: List[str]):
-    group = Counter()
-    group_count = 0
+
+def popcount(mask: int) -> int:
+    return bin(mask).count("1")
+
+
+def answer_mask(answers: str) -> int:
+    mask = 0
+    for char in answers:
+        mask |= letter_bits[char]
+    return mask
+
+
+def count_answers(lines: Iterable[str]) -> Tuple[int, int]:
+    any_total, all_total = 0, 0
+    any_mask, all_mask = 0, all_questions
 
     for line in lines:
         if line != '':
-            group.update(Counter(line))
-            group_count += 1
+            mask = answer_mask(line)
+            any_mask |= mask
+            all_mask &= mask
+            continue
+
+        # nobody answers with an empty line, so an empty any_mask means there was no group
+        if any_mask:
+            any_total += popcount(any_mask)
+            all_total += popcount(all_mask)
+        any_mask, all_mask = 0, all_questions
+
+    if any_mask:
+        any_total += popcount(any_mask)
+        all_total += popcount(all_mask)
+
+    return any_total, all_total
+
+
+def answer_masks(input_: str) -> Tuple[np.ndarray, np.ndarray]:
+    # one mask per person, plus the offsets into them where each group starts
+    # splitlines took \r\n endings in its stride, so they're folded into plain newlines here
+    data = np.frombuffer(input_.replace("\r\n", "\n").encode("ascii"), dtype=np.uint8)
+    is_letter = data != ord("\n")
+    # anything below "a" wraps round in uint8, so one comparison catches it along with the rest
+    letters = data[is_letter] - ord("a")
+    if (letters >= 26).any():
+        raise ValueError("Answers can only be the letters a to z, one person per line")
+    bits = np.left_shift(1, letters, dtype=np.uint32)
+
+    newlines = np.flatnonzero(~is_letter)
+    line_starts = np.concatenate(([0], newlines + 1))
+    line_lengths = np.concatenate((newlines, [len(data)])) - line_starts
+
+    # every line before this one ended with a newline that isn't in bits
+    letter_starts = line_starts - np.arange(len(line_starts))
+    people = line_lengths > 0
+    if not people.any():
+        return np.zeros(0, dtype=np.uint32), np.zeros(0, dtype=np.intp)
+
+    masks = np.bitwise_or.reduceat(bits, letter_starts[people])
+
+    # a group starts with anyone who doesn't follow someone else
+    after_person = np.concatenate(([False], people[:-1]))
+    group_offsets = np.flatnonzero(~after_person[people])
+
+    return masks, group_offsets
+
+
+def vector_popcount(masks: np.ndarray) -> np.ndarray:
+    return popcount_table[masks.view(np.uint8)].reshape(-1, masks.itemsize).sum(axis=1)
 
-        else:
-            yield group, group_count
-            group = Counter()
-            group_count = 0
 
-    yield group, group_count
+def count_groups(masks: np.ndarray, group_offsets: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    if not len(masks):
+        return np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.intp)
 
+    any_masks = np.bitwise_or.reduceat(masks, group_offsets)
+    all_masks = np.bitwise_and.reduceat(masks, group_offsets)
 
-def count_yaaaases(lines: List[str]):
-    for group, group_count in get_groups(lines):
-        questions = [k for k, v in group.items() if v == group_count]
-        yield len(questions)
+    return vector_popcount(any_masks), vector_popcount(all_masks)
 
 
 def main(input_: str):
-    print(sum(count_yaaaases(input_.splitlines())))
+    any_counts, all_counts = count_groups(*answer_masks(input_))
+    print(all_counts.sum())
 
 
 if __name__ == '__main__':
@@ -44,85 +44,141 @@ How many bag colors can eventually contain at least one shiny gold bag? (The lis
 make sure you get all of it.)
 """
 import re
-from typing import Tuple, List, Dict
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from itertools import accumulate
+from typing import Tuple, List, Dict, Iterable
 
 parent_ptrn = re.compile(r"^(?P<parent>.*?)\sbags?")
 children_ptrn = re.compile(r"(?P<number>\d+)\s(?P<color>.*?)\sbags?")
 
 
-class Bag:
+@dataclass
+class BagGraph:
+    colors: List[str]
+    ids: Dict[str, int]
+    # children of bag i are targets[offsets[i]:offsets[i+1]], each held weights[...] times
+    offsets: array
+    targets: array
+    weights: array
+    # and the same again for the bags each one can be held by
+    parent_offsets: array
+    parents: array
+    parent_weights: array
 
-    def __init__(self, color):
-        self.color = color
-        self.parents: List[Tuple[int, Bag]] = []
-        self.children = []
+    def __len__(self):
+        return len(self.colors)
 
-    def __str__(self):
-        return self.color
 
-    def __repr__(self):
-        return f"Bag(color={self.color})"
+def to_csr(n_nodes: int, sources: array, targets: array, weights: array) -> Tuple[array, array, array]:
+    counts = [0] * (n_nodes + 1)
+    for source in sources:
+        counts[source + 1] += 1
+    offsets = array("I", accumulate(counts))
 
+    next_slot = offsets.tolist()
+    csr_targets = array("I", bytes(targets.itemsize * len(targets)))
+    csr_weights = array("I", bytes(weights.itemsize * len(weights)))
+    for source, target, weight in zip(sources, targets, weights):
+        slot = next_slot[source]
+        csr_targets[slot] = target
+        csr_weights[slot] = weight
+        next_slot[source] = slot + 1
 
-bags: Dict[str, Bag] = dict()
+    return offsets, csr_targets, csr_weights
 
 
-def cache_counts(f):
-    results = {}
+def build_graph(lines: Iterable[str]) -> BagGraph:
+    ids: Dict[str, int] = dict()
+    colors: List[str] = []
 
-    def inner(color: str):
-        if color in results:
-            return results[color]
-        else:
-            result = f(color)
-            results[color] = result
-            return result
+    def intern(color: str) -> int:
+        try:
+            return ids[color]
+        except KeyError:
+            ids[color] = len(colors)
+            colors.append(color)
+            return ids[color]
 
-    return inner
+    sources, targets, weights = array("I"), array("I"), array("I")
+    for line in lines:
+        parent = intern(parent_ptrn.match(line).group("parent"))
 
+        for number, child in children_ptrn.findall(line):
+            sources.append(parent)
+            targets.append(intern(child))
+            weights.append(int(number))
 
-def get_bag(color):
-    try:
-        child_bag = bags[color]
-    except KeyError:
-        child_bag = Bag(color)
-        bags[color] = child_bag
+    return BagGraph(
+        colors,
+        ids,
+        *to_csr(len(colors), sources, targets, weights),
+        *to_csr(len(colors), targets, sources, weights)
+    )
 
-    return child_bag
 
+def find_ancestors(graph: BagGraph, node: int) -> List[int]:
+    seen = bytearray(len(graph))
+    queue = deque([node])
+    ancestors = []
 
-def parse_line(line: str):
+    while queue:
+        current = queue.popleft()
+        for parent in graph.parents[graph.parent_offsets[current]:graph.parent_offsets[current+1]]:
+            if not seen[parent]:
+                seen[parent] = 1
+                ancestors.append(parent)
+                queue.append(parent)
 
-    parent = parent_ptrn.match(line).group("parent")
-    parent_bag = get_bag(color=parent)
+    return ancestors
 
-    for number, child in children_ptrn.findall(line):
-        child_bag = get_bag(color=child)
 
-        parent_bag.children.append(child_bag)
-        child_bag.parents.append((number, parent_bag))
+def popcount(mask: int) -> int:
+    return bin(mask).count("1")
 
-    bags[parent] = parent_bag
 
+def topological_order(graph: BagGraph) -> List[int]:
+    # every bag comes after all of the bags that can hold it
+    in_degree = [graph.parent_offsets[i+1] - graph.parent_offsets[i] for i in range(len(graph))]
+    queue = deque(node for node, degree in enumerate(in_degree) if not degree)
+    order = []
 
-def create_bags(input_: str):
-    for line in input_.splitlines():
-        parse_line(line)
+    while queue:
+        node = queue.popleft()
+        order.append(node)
+        for child in graph.targets[graph.offsets[node]:graph.offsets[node+1]]:
+            in_degree[child] -= 1
+            if not in_degree[child]:
+                queue.append(child)
 
+    if len(order) != len(graph):
+        raise ValueError("Bag rules contain a cycle")
 
-@cache_counts
-def get_potential_parents(color):
-    if color:
-        for number, parent in bags[color].parents:
-            yield parent.color
-            yield from get_potential_parents(color=parent.color)
+    return order
+
+
+def ancestor_sets(graph: BagGraph) -> List[int]:
+    # bit i of ancestors[node] is set when bag i can eventually hold node
+    ancestors = [0] * len(graph)
+
+    for node in topological_order(graph):
+        held_by = ancestors[node] | (1 << node)
+        for child in graph.targets[graph.offsets[node]:graph.offsets[node+1]]:
+            ancestors[child] |= held_by
+
+    return ancestors
+
+
+def ancestor_counts(graph: BagGraph) -> array:
+    return array("I", (popcount(ancestors) for ancestors in ancestor_sets(graph)))
 
 
 def main(input_: str):
-    create_bags(input_)
+    graph = build_graph(input_.splitlines())
     our_bag = "shiny gold"
-    potential_parents = set(get_potential_parents(our_bag))
-    print(len(potential_parents))
+    potential_parents = ancestor_counts(graph)
+    print(potential_parents[graph.ids[our_bag]])
 
 
 if __name__ == '__main__':
@@ -79,7 +79,11 @@ In this example, a single shiny gold bag must contain 126 other bags.
 How many individual bags are required inside your single shiny gold bag?
 """
 import re
-from typing import List, Dict
+from array import array
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from itertools import accumulate
+from typing import List, Dict, FrozenSet, Iterable, Set, Tuple
 
 from utils import timeit
 
@@ -87,82 +91,210 @@ parent_ptrn = re.compile(r"^(?P<parent>.*?)\sbags?")
 children_ptrn = re.compile(r"(?P<number>\d+)\s(?P<color>.*?)\sbags?")
 
 
-class Bag:
+@dataclass
+class BagGraph:
+    colors: List[str]
+    ids: Dict[str, int]
+    # children of bag i are targets[offsets[i]:offsets[i+1]], each held weights[...] times
+    offsets: array
+    targets: array
+    weights: array
+    # and the same again for the bags each one can be held by
+    parent_offsets: array
+    parents: array
+    parent_weights: array
 
-    def __init__(self, color):
-        self.color = color
-        self.parents: Dict[Bag, int] = dict()
-        self.children: List[Bag] = []
+    def __len__(self):
+        return len(self.colors)
 
-    def __str__(self):
-        return self.color
 
-    def __repr__(self):
-        return f"Bag(color={self.color})"
+def to_csr(n_nodes: int, sources: array, targets: array, weights: array) -> Tuple[array, array, array]:
+    counts = [0] * (n_nodes + 1)
+    for source in sources:
+        counts[source + 1] += 1
+    offsets = array("I", accumulate(counts))
+
+    next_slot = offsets.tolist()
+    csr_targets = array("I", bytes(targets.itemsize * len(targets)))
+    csr_weights = array("I", bytes(weights.itemsize * len(weights)))
+    for source, target, weight in zip(sources, targets, weights):
+        slot = next_slot[source]
+        csr_targets[slot] = target
+        csr_weights[slot] = weight
+        next_slot[source] = slot + 1
 
+    return offsets, csr_targets, csr_weights
 
-bags: Dict[str, Bag] = dict()
 
+def build_graph(lines: Iterable[str]) -> BagGraph:
+    ids: Dict[str, int] = dict()
+    colors: List[str] = []
 
-def get_bag(color):
-    try:
-        child_bag = bags[color]
-    except KeyError:
-        child_bag = Bag(color)
-        bags[color] = child_bag
+    def intern(color: str) -> int:
+        try:
+            return ids[color]
+        except KeyError:
+            ids[color] = len(colors)
+            colors.append(color)
+            return ids[color]
 
-    return child_bag
+    sources, targets, weights = array("I"), array("I"), array("I")
+    for line in lines:
+        parent = intern(parent_ptrn.match(line).group("parent"))
 
+        for number, child in children_ptrn.findall(line):
+            sources.append(parent)
+            targets.append(intern(child))
+            weights.append(int(number))
 
-def parse_line(line: str):
+    return BagGraph(
+        colors,
+        ids,
+        *to_csr(len(colors), sources, targets, weights),
+        *to_csr(len(colors), targets, sources, weights)
+    )
 
-    parent = parent_ptrn.match(line).group("parent")
-    parent_bag = get_bag(color=parent)
 
-    for number, child in children_ptrn.findall(line):
-        child_bag = get_bag(color=child)
+def topological_order(graph: BagGraph) -> List[int]:
+    # every bag comes after all of the bags that can hold it
+    in_degree = [graph.parent_offsets[i+1] - graph.parent_offsets[i] for i in range(len(graph))]
+    queue = deque(node for node, degree in enumerate(in_degree) if not degree)
+    order = []
 
-        parent_bag.children.append(child_bag)
-        child_bag.parents[parent_bag] = int(number)
+    while queue:
+        node = queue.popleft()
+        order.append(node)
+        for child in graph.targets[graph.offsets[node]:graph.offsets[node+1]]:
+            in_degree[child] -= 1
+            if not in_degree[child]:
+                queue.append(child)
 
-    bags[parent] = parent_bag
+    if len(order) != len(graph):
+        raise ValueError("Bag rules contain a cycle")
 
+    return order
 
-def create_bags(input_: str):
-    for line in input_.splitlines():
-        parse_line(line)
 
+def contained_counts(graph: BagGraph) -> List[int]:
+    # children are always counted before the bags holding them
+    counts = [0] * len(graph)
 
-def cache_counts(f):
-    results = {}
+    for node in reversed(topological_order(graph)):
+        start, end = graph.offsets[node], graph.offsets[node+1]
+        counts[node] = sum(
+            number * (1 + counts[child])
+            for child, number in zip(graph.targets[start:end], graph.weights[start:end])
+        )
 
-    def inner(color: str):
-        if color in results:
-            return results[color]
-        else:
-            result = f(color)
-            results[color] = result
-            return result
+    return counts
 
-    return inner
 
+class BagRules:
+
+    def __init__(self, lines: Iterable[str] = ()):
+        self._children: Dict[str, Dict[str, int]] = defaultdict(dict)
+        self._parents: Dict[str, Set[str]] = defaultdict(set)
+        self._counts: Dict[str, int] = dict()
+        self._ancestors: Dict[str, FrozenSet[str]] = dict()
+
+        for line in lines:
+            self.add_rule(line)
 
-@cache_counts
-def count_bags_for_color(color: str):
-    bag = bags[color]
-    total_bags = 1
-    for child in bag.children:
-        total_bags += count_bags_for_color(child.color)*child.parents[bag]
-    return total_bags
+    def __repr__(self):
+        return f"BagRules(colors={len(self._children)})"
+
+    def add_rule(self, line: str):
+        color = parent_ptrn.match(line).group("parent")
+        children = {child: int(number) for number, child in children_ptrn.findall(line)}
+        self._set_children(color, children)
+
+    def remove_rule(self, color: str):
+        self._set_children(color, {})
+
+    def _set_children(self, color: str, children: Dict[str, int]):
+        old_children = self._children[color]
+        self._invalidate(color, old_children.keys() | children.keys())
+
+        for child in old_children:
+            self._parents[child].discard(color)
+        for child in children:
+            self._parents[child].add(color)
+            self._children.setdefault(child, {})
+        self._children[color] = children
+
+    def _invalidate(self, color: str, children: Iterable[str]):
+        # the count changes for this colour and everything that can hold it. Anything already
+        # counted had all of its contents counted too, so the walk can stop at uncounted bags
+        queue = deque([color])
+        while queue:
+            current = queue.popleft()
+            if self._counts.pop(current, None) is not None:
+                queue.extend(self._parents.get(current, ()))
+
+        # and the ancestors change for everything below the edges being swapped
+        seen = set(children)
+        queue = deque(seen)
+        while queue:
+            current = queue.popleft()
+            self._ancestors.pop(current, None)
+            for child in self._children[current].keys() - seen:
+                seen.add(child)
+                queue.append(child)
+
+    def _check_known(self, color: str):
+        # every colour named in a rule is known, whether or not it holds anything
+        if color not in self._children:
+            raise KeyError(f"No rule mentions {color} bags")
+
+    def count(self, color: str) -> int:
+        self._check_known(color)
+        counts = self._counts
+        if color in counts:
+            return counts[color]
+
+        on_path = set()
+        stack = [color]
+        while stack:
+            current = stack[-1]
+            if current in counts:
+                stack.pop()
+                continue
+
+            children = self._children.get(current, {})
+            pending = [child for child in children if child not in counts]
+            if not pending:
+                counts[current] = sum(number * (1 + counts[child]) for child, number in children.items())
+                on_path.discard(current)
+                stack.pop()
+                continue
+
+            if on_path.intersection(pending):
+                raise ValueError(f"Bag rules contain a cycle through {current}")
+            on_path.add(current)
+            stack.extend(pending)
+
+        return counts[color]
+
+    def ancestors(self, color: str) -> FrozenSet[str]:
+        self._check_known(color)
+        if color not in self._ancestors:
+            seen = set()
+            queue = deque([color])
+            while queue:
+                for parent in self._parents.get(queue.popleft(), set()) - seen:
+                    seen.add(parent)
+                    queue.append(parent)
+            self._ancestors[color] = frozenset(seen)
+
+        return self._ancestors[color]
 
 
 @timeit(iterations=10)
 def main(input_: str):
-    create_bags(input_)
+    graph = build_graph(input_.splitlines())
     our_bag = "shiny gold"
 
-    # minus one for our own bag
-    print(count_bags_for_color(our_bag)-1)
+    print(contained_counts(graph)[graph.ids[our_bag]])
 
 
 if __name__ == '__main__':
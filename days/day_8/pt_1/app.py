@@ -73,83 +73,12 @@ Immediately before the program would run an instruction a second time, the value
 Run your copy of the boot code.
 Immediately before any instruction is executed a second time, what value is in the accumulator?
 """
-from collections import deque, Counter
-from dataclasses import dataclass
-from enum import Enum
-import re
-from typing import List
-
-
-class InstructionEnum(str, Enum):
-    acc = "acc"
-    jmp = "jmp"
-    nop = "nop"
-
-
-@dataclass
-class Instruction:
-    idx: int
-    name: InstructionEnum
-    value: int
-
-
-class VM:
-
-    def __init__(self, instructions: List[Instruction], max_iteration: int = 2):
-        self._max_iterations = max_iteration
-        self._acc = 0
-
-        self._instructions = deque(instructions)
-        self._instruction_counter = Counter()
-
-        self._instructions_map = {
-            InstructionEnum.acc: self.update_acc,
-            InstructionEnum.jmp: self.jump,
-            InstructionEnum.nop: self.nop
-        }
-
-    def run(self):
-        steps = 0
-        while True:
-            steps += 1
-            print(steps)
-
-            current_instruction = self._instructions[0]
-            self.update_counter(current_instruction)
-            f = self._instructions_map[current_instruction.name]
-            f(value=current_instruction.value)
-
-    def update_counter(self, instruction):
-        self._instruction_counter[instruction.idx] += 1
-        if self._instruction_counter[instruction.idx] == self._max_iterations:
-            raise StopIteration(f"VM has reached max iterations. Current ACC: {self._acc}")
-
-    def jump(self, value: int):
-        self._instructions.rotate(-value)
-
-    def update_acc(self, value: int):
-        self._acc += value
-        self.jump(1)
-
-    def nop(self, value: int):
-        self.jump(value=1)
-
-
-def create_instructions(lines: List[str]):
-    instruction_ptrn = re.compile(r"^(?P<name>\w+)\s(?P<value>.*)$")
-
-    for idx, line in enumerate(lines):
-        m = instruction_ptrn.match(line)
-        yield Instruction(
-            idx=idx,
-            name=InstructionEnum(m.group("name")),
-            value=int(m.group("value"))
-        )
+from days.day_8.vm import VM, create_instructions
 
 
 def main(input_):
-    vm = VM(instructions=list(create_instructions(input_.splitlines())))
-    vm.run()
+    vm = VM(instructions=create_instructions(input_.splitlines()))
+    print(vm.run().acc)
 
 
 if __name__ == '__main__':
@@ -125,111 +125,63 @@ With this change, after the program terminates, the accumulator contains the val
 Fix the program so that it terminates normally by changing exactly one jmp (to nop) or nop (to jmp).
 What is the value of the accumulator after the program terminates?
 """
-from collections import Counter
-from dataclasses import dataclass
-from enum import Enum
-import re
-from typing import List
+from multiprocessing import get_context
+from typing import Optional, Tuple
 
+from days.day_8.vm import VM, Result, Status, create_instructions
 from utils import timeit
 
 
-class InstructionEnum(str, Enum):
-    acc = "acc"
-    jmp = "jmp"
-    nop = "nop"
+# each pool worker holds the VM it inherited when the pool started, so candidates only send an index
+_worker_vm: Optional[VM] = None
 
 
-@dataclass
-class Instruction:
-    name: InstructionEnum
-    value: int
+def _init_worker(vm: VM):
+    global _worker_vm
+    _worker_vm = vm
 
 
-class VM:
+def _try_flip(idx: int) -> Optional[Tuple[int, Result]]:
+    _worker_vm.flip(idx)
+    result = _worker_vm.run()
+    _worker_vm.flip(idx)
 
-    def __init__(self, instructions: List[Instruction], max_iteration: int = 2):
-        self._max_iterations = max_iteration
-        self._acc = 0
+    if result.status == Status.terminated:
+        return idx, result
+    return None
 
-        self._instructions = instructions
-        self._current_idx = 0
 
-        self._instruction_counter = Counter()
+def parallel_repair(
+        vm: VM,
+        processes: Optional[int] = None,
+        chunksize: int = 16,
+        start_method: Optional[str] = None
+) -> Optional[Tuple[int, Result]]:
+    candidates = list(vm.flip_candidates())
 
-        self._instructions_map = {
-            InstructionEnum.acc: self.update_acc,
-            InstructionEnum.jmp: self.jump,
-            InstructionEnum.nop: self.nop
-        }
+    # leaving the with block terminates the pool, dropping any candidates still queued
+    context = get_context(start_method)
+    with context.Pool(processes, initializer=_init_worker, initargs=(vm,)) as pool:
+        for repaired in pool.imap_unordered(_try_flip, candidates, chunksize):
+            if repaired is not None:
+                return repaired
 
-    def __repr__(self):
-        return f"VM(acc={self._acc}, idx={self._current_idx})"
-
-    def run(self):
-        while True:
-            self.update_counter(self._current_idx)
-
-            try:
-                current_instruction = self._instructions[self._current_idx]
-            except IndexError:
-                return self._acc
-            else:
-                f = self._instructions_map[current_instruction.name]
-                f(value=current_instruction.value)
-
-    def update_counter(self, idx):
-        self._instruction_counter[idx] += 1
-        if self._instruction_counter[idx] == self._max_iterations:
-            raise StopIteration(f"VM has reached max iterations. Current ACC: {self._acc}")
-
-    def jump(self, value: int):
-        self._current_idx += value
-
-    def update_acc(self, value: int):
-        self._acc += value
-        self.jump(1)
-
-    def nop(self, value: int):
-        self.jump(value=1)
-
-
-@timeit(iterations=10)
-def create_instructions(lines: List[str]):
-    instruction_ptrn = re.compile(r"^(?P<name>\w+)\s(?P<value>.*)$")
-
-    instructions = []
-
-    for idx, line in enumerate(lines):
-        m = instruction_ptrn.match(line)
-        instructions.append(Instruction(
-            name=InstructionEnum(m.group("name")),
-            value=int(m.group("value"))
-        ))
-
-    return instructions
+    return None
 
 
 @timeit(iterations=10)
 def main(input_):
-
     instructions = create_instructions(input_.splitlines())
+    vm = VM(instructions=instructions)
 
-    for idx in range(len(instructions)):
-        original_instruction = instructions[idx]
-
-        if original_instruction.name != InstructionEnum.acc:
-            name = InstructionEnum.jmp if original_instruction.name == InstructionEnum.nop else InstructionEnum.nop
-            instructions[idx] = Instruction(name=name, value=original_instruction.value)
-
-            vm = VM(instructions=instructions)
-
-            try:
-                print(vm.run())
-                return
+    for idx in vm.flip_candidates():
+        vm.flip(idx)
+        result = vm.run()
+        vm.flip(idx)
 
-            except StopIteration:
-                instructions[idx] = original_instruction
+        if result.status == Status.terminated:
+            print(result.acc)
+            return
 
 
 if __name__ == '__main__':
@@ -0,0 +1,307 @@
+"""
+Handheld game console VM shared by both parts of day 8.
+
+Programs are decoded once into a bytearray of opcodes and an array of int32 operands, which is
+also all the bytecode format holds:
+
+```
+magic    4 bytes   b"HGC1" when written on a little-endian machine, b"HGC2" on a big-endian one
+length   uint32    number of instructions
+opcodes  length    one byte each
+padding  0-3       zero bytes, so the operands are 4 byte aligned
+operands length*4  int32, native byte order
+```
+
+Bytecode only loads on a machine with the same byte order as the one that wrote it.
+"""
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+import mmap
+import re
+import struct
+import sys
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+instruction_ptrn = re.compile(r"^(?P<name>\w+)\s(?P<value>.*)$")
+
+bytecode_magic = b"HGC1" if sys.byteorder == "little" else b"HGC2"
+bytecode_header = struct.Struct("=4sI")
+
+
+class InstructionEnum(str, Enum):
+    acc = "acc"
+    jmp = "jmp"
+    nop = "nop"
+
+
+@dataclass
+class Instruction:
+    name: str
+    value: int
+
+
+@dataclass
+class Opcode:
+    name: str
+    code: int
+    # takes (acc, idx, operand) and returns the new (acc, idx)
+    step: Callable[[int, int, int], Tuple[int, int]]
+
+
+class Status(str, Enum):
+    terminated = "terminated"
+    looped = "looped"
+    out_of_bounds = "out_of_bounds"
+
+
+@dataclass
+class Result:
+    status: Status
+    acc: int
+    idx: int
+
+
+@dataclass
+class Trace:
+    steps: array
+    opcode_counts: Dict[str, int]
+    # where the program started repeating itself, and how many steps each repeat takes
+    loop_start: Optional[int] = None
+    cycle_length: Optional[int] = None
+
+
+opcode_registry: Dict[str, Opcode] = dict()
+opcode_steps: List[Callable[[int, int, int], Tuple[int, int]]] = []
+
+
+def register_opcode(name: str, step: Callable[[int, int, int], Tuple[int, int]]) -> Opcode:
+    # codes are handed out in registration order, so bytecode using custom opcodes needs
+    # them registered in the same order when it's loaded
+    if name in opcode_registry:
+        raise ValueError(f"Opcode {name} is already registered")
+    if len(opcode_registry) == 256:
+        raise ValueError("No opcodes left, they have to fit in a byte")
+
+    opcode = Opcode(name=name, code=len(opcode_registry), step=step)
+    opcode_registry[name] = opcode
+    opcode_steps.append(step)
+    return opcode
+
+
+ACC = register_opcode(InstructionEnum.acc, lambda acc, idx, value: (acc + value, idx + 1)).code
+JMP = register_opcode(InstructionEnum.jmp, lambda acc, idx, value: (acc, idx + value)).code
+NOP = register_opcode(InstructionEnum.nop, lambda acc, idx, value: (acc, idx + 1)).code
+
+
+class VM:
+    def __init__(self, instructions: List[Instruction]):
+        # decoded once up front so the run loop only ever touches flat arrays
+        self._opcodes: Union[bytearray, memoryview] = bytearray(
+            opcode_registry[instruction.name].code for instruction in instructions
+        )
+        self._operands: Union[array, memoryview] = array("i", (instruction.value for instruction in instructions))
+        self._acc = 0
+        self._current_idx = 0
+
+    def __repr__(self):
+        return f"VM(acc={self._acc}, idx={self._current_idx})"
+
+    def __len__(self):
+        return len(self._opcodes)
+
+    def __getstate__(self):
+        # views onto bytecode can't be pickled, so a pickled VM always carries its own copies
+        state = self.__dict__.copy()
+        state["_opcodes"] = bytearray(self._opcodes)
+        state["_operands"] = array("i", self._operands)
+        return state
+
+    @classmethod
+    def from_bytecode(cls, buffer) -> "VM":
+        # the opcodes and operands are views straight onto the buffer, nothing is copied. A read only
+        # buffer gets its opcodes copied the first time flip writes to them
+        view = memoryview(buffer)
+        magic, n_instructions = bytecode_header.unpack_from(view)
+        if magic != bytecode_magic:
+            raise ValueError(f"Not bytecode for this machine, magic was {magic!r}")
+
+        opcodes_start = bytecode_header.size
+        operands_start = opcodes_start + n_instructions + (-(opcodes_start + n_instructions) % 4)
+        operands_end = operands_start + 4 * n_instructions
+        if len(view) < operands_end:
+            raise ValueError("Bytecode is truncated")
+
+        opcodes = view[opcodes_start:opcodes_start+n_instructions]
+        # catches corrupt bytecode, or bytecode using custom opcodes nobody registered here
+        if max(opcodes, default=0) >= len(opcode_steps):
+            raise ValueError(f"Bytecode uses opcode {max(opcodes)}, only {len(opcode_steps)} are registered")
+
+        vm = cls(instructions=[])
+        vm._opcodes = opcodes
+        vm._operands = view[operands_start:operands_end].cast("i")
+        return vm
+
+    def to_bytecode(self) -> bytes:
+        n_instructions = len(self._opcodes)
+        padding = -(bytecode_header.size + n_instructions) % 4
+
+        return b"".join((
+            bytecode_header.pack(bytecode_magic, n_instructions),
+            bytes(self._opcodes),
+            bytes(padding),
+            array("i", self._operands).tobytes(),
+        ))
+
+    def run(self) -> Result:
+        opcodes, operands = self._opcodes, self._operands
+        n_instructions = len(opcodes)
+        visited = bytearray(n_instructions)
+        acc, idx = 0, 0
+
+        while 0 <= idx < n_instructions:
+            if visited[idx]:
+                status = Status.looped
+                break
+            visited[idx] = 1
+
+            opcode = opcodes[idx]
+            if opcode == ACC:
+                acc += operands[idx]
+                idx += 1
+            elif opcode == JMP:
+                idx += operands[idx]
+            elif opcode == NOP:
+                idx += 1
+            else:
+                acc, idx = opcode_steps[opcode](acc, idx, operands[idx])
+        else:
+            status = Status.terminated if idx == n_instructions else Status.out_of_bounds
+
+        self._acc, self._current_idx = acc, idx
+        return Result(status=status, acc=acc, idx=idx)
+
+    def trace(self) -> Tuple[Result, Trace]:
+        # same as run, but kept separate so run doesn't pay for the bookkeeping
+        opcodes, operands = self._opcodes, self._operands
+        n_instructions = len(opcodes)
+        first_step = array("i", [-1]) * n_instructions
+        steps = array("i")
+        counts = [0] * len(opcode_steps)
+        acc, idx = 0, 0
+        loop_start, cycle_length = None, None
+
+        while 0 <= idx < n_instructions:
+            if first_step[idx] != -1:
+                status = Status.looped
+                loop_start, cycle_length = idx, len(steps) - first_step[idx]
+                break
+            first_step[idx] = len(steps)
+            steps.append(idx)
+
+            opcode = opcodes[idx]
+            counts[opcode] += 1
+            acc, idx = opcode_steps[opcode](acc, idx, operands[idx])
+        else:
+            status = Status.terminated if idx == n_instructions else Status.out_of_bounds
+
+        self._acc, self._current_idx = acc, idx
+        trace = Trace(
+            steps=steps,
+            opcode_counts={name: counts[opcode.code] for name, opcode in opcode_registry.items()},
+            loop_start=loop_start,
+            cycle_length=cycle_length
+        )
+        return Result(status=status, acc=acc, idx=idx), trace
+
+    def flip(self, idx: int):
+        # swaps a jmp for a nop and back again, leaving anything else alone
+        if self._opcodes[idx] in (JMP, NOP):
+            if getattr(self._opcodes, "readonly", False):
+                self._opcodes = bytearray(self._opcodes)
+            self._opcodes[idx] = JMP if self._opcodes[idx] == NOP else NOP
+
+    def flip_candidates(self) -> Iterator[int]:
+        # every index flip would actually change
+        for idx, opcode in enumerate(self._opcodes):
+            if opcode in (JMP, NOP):
+                yield idx
+
+    def _next_idx(self, idx: int, flipped: bool = False) -> int:
+        opcode = self._opcodes[idx]
+        if flipped and opcode in (JMP, NOP):
+            opcode = JMP if opcode == NOP else NOP
+        return opcode_steps[opcode](0, idx, self._operands[idx])[1]
+
+    def _reaches_end(self) -> bytearray:
+        # walk backwards from just past the last instruction to everything that ends up there
+        n_instructions = len(self._opcodes)
+        predecessors = [[] for _ in range(n_instructions + 1)]
+        for idx in range(n_instructions):
+            next_idx = self._next_idx(idx)
+            if 0 <= next_idx <= n_instructions:
+                predecessors[next_idx].append(idx)
+
+        reaches_end = bytearray(n_instructions + 1)
+        reaches_end[n_instructions] = 1
+        queue = deque([n_instructions])
+        while queue:
+            for idx in predecessors[queue.popleft()]:
+                if not reaches_end[idx]:
+                    reaches_end[idx] = 1
+                    queue.append(idx)
+
+        return reaches_end
+
+    def repair(self) -> Optional[Tuple[int, Result]]:
+        # the first instruction on the looping path that can be flipped onto a terminating one
+        n_instructions = len(self._opcodes)
+        reaches_end = self._reaches_end()
+        if reaches_end[0]:
+            # already terminates, there's nothing to repair
+            return None
+
+        visited = bytearray(n_instructions)
+        idx = 0
+
+        while 0 <= idx < n_instructions and not visited[idx]:
+            visited[idx] = 1
+
+            if self._opcodes[idx] in (JMP, NOP):
+                flipped_idx = self._next_idx(idx, flipped=True)
+                if 0 <= flipped_idx <= n_instructions and reaches_end[flipped_idx]:
+                    self.flip(idx)
+                    result = self.run()
+                    self.flip(idx)
+                    if result.status == Status.terminated:
+                        return idx, result
+
+            idx = self._next_idx(idx)
+
+        return None
+
+
+def create_instructions(lines: List[str]) -> List[Instruction]:
+    instructions = []
+
+    for line in lines:
+        m = instruction_ptrn.match(line)
+        name = m.group("name")
+        if name not in opcode_registry:
+            raise ValueError(f"Unknown instruction {line!r}")
+
+        instructions.append(Instruction(name=name, value=int(m.group("value"))))
+
+    return instructions
+
+
+def save_bytecode(vm: VM, path: str):
+    with open(path, "wb") as f:
+        f.write(vm.to_bytecode())
+
+
+def load_bytecode(path: str) -> VM:
+    # a private copy-on-write mapping, so VM.flip never writes back to the file
+    with open(path, "rb") as f:
+        return VM.from_bytecode(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY))
@@ -60,36 +60,105 @@ The first step of attacking the weakness in the XMAS data is to find the first n
 (after the preamble) which is not the sum of two of the 25 numbers before it.
 What is the first number that does not have this property?
 """
+from collections import Counter, deque
+from dataclasses import dataclass
+from itertools import chain, islice
+from typing import Generator, Iterable, List, Optional, TextIO, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+@dataclass
+class Checkpoint:
+    # how many numbers have been read so far, and the last preamble_length of them
+    position: int
+    preamble: List[int]
+
+
 class Program:
+    def __init__(self, program: Iterable[int], preamble_length: int = 5):
+        self._program = iter(program)
+        self._preamble = deque(islice(self._program, preamble_length))
+        self._preamble_counts = Counter(self._preamble)
+        self._position = len(self._preamble)
 
-    def __init__(self, program, preamble_length: int = 5):
-        self._program = list(program)
-        self._preamble = [self._program.pop(0) for _ in range(preamble_length)]
+    @classmethod
+    def resume(cls, checkpoint: Checkpoint, program: Iterable[int]) -> "Program":
+        # program carries on from where the checkpoint was taken
+        resumed = cls(program=chain(checkpoint.preamble, program), preamble_length=len(checkpoint.preamble))
+        resumed._position = checkpoint.position
+        return resumed
 
-    def _calc_sums(self):
-        sums = set()
-        for idx, a in enumerate(self._preamble):
-            for b in self._preamble[idx+1:]:
-                if a != b:
-                    sums.add(a+b)
-        return sums
+    def checkpoint(self) -> Checkpoint:
+        return Checkpoint(position=self._position, preamble=list(self._preamble))
 
-    def run(self):
-        while True:
-            sums = self._calc_sums()
-            value = self._program.pop(0)
+    def _is_valid(self, value: int) -> bool:
+        # two different numbers from the preamble have to add up to value
+        counts = self._preamble_counts
+        for a in counts:
+            b = value - a
+            if b != a and b in counts:
+                return True
+        return False
 
-            if value not in sums:
-                return value
+    def invalid_numbers(self) -> Generator[Tuple[int, int], None, None]:
+        # yields (position, value), only after value has joined the preamble so a checkpoint
+        # taken between yields picks up with the next number
+        for value in self._program:
+            is_valid = self._is_valid(value)
+
+            oldest = self._preamble.popleft()
+            self._preamble_counts[oldest] -= 1
+            if not self._preamble_counts[oldest]:
+                del self._preamble_counts[oldest]
 
-            _ = self._preamble.pop(0)
             self._preamble.append(value)
+            self._preamble_counts[value] += 1
+            self._position += 1
+
+            if not is_valid:
+                yield self._position - 1, value
+
+    def run(self) -> Optional[int]:
+        for _, value in self.invalid_numbers():
+            return value
+        return None
 
 
 def clean_input(input_: str):
     return (int(v) for v in input_.splitlines())
 
 
+def read_numbers(handle: TextIO):
+    return (int(line) for line in handle if line.strip())
+
+
+def load_numbers(input_: str) -> np.ndarray:
+    return np.array(input_.split(), dtype=np.int64)
+
+
+def invalid_mask(numbers: np.ndarray, preamble_length: int, max_pair_sums: int = 1 << 22) -> np.ndarray:
+    # True for every position whose number isn't the sum of two different numbers in the
+    # preamble_length before it. The preamble itself can't be invalid
+    mask = np.zeros(len(numbers), dtype=bool)
+    if len(numbers) <= preamble_length:
+        return mask
+
+    windows = sliding_window_view(numbers[:-1], preamble_length)
+    targets = numbers[preamble_length:]
+
+    # every window broadcasts out to preamble_length**2 pair sums, so go a chunk of windows at a time
+    chunk_size = max(1, max_pair_sums // preamble_length**2)
+    for start in range(0, len(targets), chunk_size):
+        chunk = windows[start:start+chunk_size]
+        a, b = chunk[:, :, None], chunk[:, None, :]
+        is_sum = (a + b == targets[start:start+chunk_size, None, None]) & (a != b)
+        mask[preamble_length+start:preamble_length+start+len(chunk)] = ~is_sum.any(axis=(1, 2))
+
+    return mask
+
+
 def main(input_: str, preamble_length: int):
     p = Program(program=clean_input(input_), preamble_length=preamble_length)
     print(p.run())
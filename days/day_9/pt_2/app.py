@@ -99,37 +99,110 @@ in this example, these are 15 and 47, producing 62.
 
 What is the encryption weakness in your XMAS-encrypted list of numbers?
 """
+from collections import Counter, deque
+from dataclasses import dataclass
+from itertools import islice
+from typing import Iterable, List, Optional
 
 
 class Program:
-    def __init__(self, program, preamble_length: int = 5):
-        self._program = program
-        self._preamble = [self._program.pop(0) for _ in range(preamble_length)]
+    def __init__(self, program: Iterable[int], preamble_length: int = 5):
+        self._program = iter(program)
+        self._preamble = deque(islice(self._program, preamble_length))
+        self._preamble_counts = Counter(self._preamble)
 
-    def _calc_sums(self):
-        sums = set()
-        for idx, a in enumerate(self._preamble):
-            for b in self._preamble[idx+1:]:
-                if a != b:
-                    sums.add(a+b)
-        return sums
+    def _is_valid(self, value: int) -> bool:
+        # two different numbers from the preamble have to add up to value
+        counts = self._preamble_counts
+        for a in counts:
+            b = value - a
+            if b != a and b in counts:
+                return True
+        return False
 
-    def run(self):
-        while True:
-            sums = self._calc_sums()
-            value = self._program.pop(0)
-
-            if value not in sums:
+    def run(self) -> Optional[int]:
+        for value in self._program:
+            if not self._is_valid(value):
                 return value
 
-            _ = self._preamble.pop(0)
+            oldest = self._preamble.popleft()
+            self._preamble_counts[oldest] -= 1
+            if not self._preamble_counts[oldest]:
+                del self._preamble_counts[oldest]
+
             self._preamble.append(value)
+            self._preamble_counts[value] += 1
+
+        return None
 
 
 def clean_input(input_: str):
     return [int(v) for v in input_.splitlines()]
 
 
+@dataclass
+class ContiguousRange:
+    start: int
+    stop: int
+    smallest: int
+    largest: int
+
+
+def find_range_two_pointer(numbers: List[int], target: int) -> Optional[ContiguousRange]:
+    # only works when nothing is negative, so dropping numbers off the left can only shrink the total.
+    # The deques keep the indexes of the window's min/max candidates, smallest/largest first
+    total, start = 0, 0
+    mins, maxes = deque(), deque()
+
+    for stop, value in enumerate(numbers, start=1):
+        total += value
+        while mins and numbers[mins[-1]] >= value:
+            mins.pop()
+        mins.append(stop-1)
+        while maxes and numbers[maxes[-1]] <= value:
+            maxes.pop()
+        maxes.append(stop-1)
+
+        while total > target and stop - start > 2:
+            total -= numbers[start]
+            start += 1
+            if mins[0] < start:
+                mins.popleft()
+            if maxes[0] < start:
+                maxes.popleft()
+
+        if total == target and stop - start >= 2:
+            return ContiguousRange(start, stop, numbers[mins[0]], numbers[maxes[0]])
+
+    return None
+
+
+def find_range_prefix_sums(numbers: List[int], target: int) -> Optional[ContiguousRange]:
+    # numbers[start:stop] sums to target when prefix[stop] - prefix[start] == target
+    prefixes = [0]
+    first_seen = dict()
+
+    for stop, value in enumerate(numbers, start=1):
+        prefixes.append(prefixes[-1] + value)
+
+        # ranges need at least two numbers, so start can be two behind at most
+        if stop >= 2:
+            first_seen.setdefault(prefixes[stop-2], stop-2)
+
+        start = first_seen.get(prefixes[stop] - target)
+        if start is not None:
+            contiguous = numbers[start:stop]
+            return ContiguousRange(start, stop, min(contiguous), max(contiguous))
+
+    return None
+
+
+def find_contiguous_range(numbers: List[int], target: int) -> Optional[ContiguousRange]:
+    if all(number >= 0 for number in numbers):
+        return find_range_two_pointer(numbers, target)
+    return find_range_prefix_sums(numbers, target)
+
+
 def main(input_: str, preamble_length: int):
     cleaned = clean_input(input_)
     p = Program(program=cleaned, preamble_length=preamble_length)
@@ -137,16 +210,8 @@ def main(input_: str, preamble_length: int):
 
     print(result)
 
-    cleaned = clean_input(input_)
-
-    len_ = len(cleaned)
-    for i in range(2, len_):
-        for j in range(len_-i+1):
-            # print(len(cleaned[j:j+i]))
-            s = sum(cleaned[j:j+i])
-            if s == result:
-                print(min(cleaned[j:j+i])+max(cleaned[j:j+i]))
-                return
+    contiguous = find_contiguous_range(cleaned, result)
+    print(contiguous.smallest + contiguous.largest)
 
 
 if __name__ == '__main__':
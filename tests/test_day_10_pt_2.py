@@ -0,0 +1,109 @@
+import random
+from itertools import combinations
+from unittest import TestCase
+
+from days.day_10.pt_2.app import chain_stats, clean_input, count_arrangements, counting_sort
+
+small = [16, 10, 15, 5, 1, 11, 7, 19, 6, 12, 4]
+large = [
+    28, 33, 18, 42, 31, 14, 46, 20, 48, 47, 24, 23, 49, 45, 19, 38, 39, 11, 1, 32, 25, 35, 8, 17, 7, 9, 4, 2, 34, 10, 3
+]
+
+
+class TestCountArrangements(TestCase):
+
+    def test_examples(self):
+        self.assertEqual(count_arrangements(sorted(small)), 8)
+        self.assertEqual(count_arrangements(clean_input("\n".join(str(a) for a in large))), 19208)
+
+    def test_gap_too_large(self):
+        self.assertEqual(count_arrangements([1, 2, 6]), 0)
+        self.assertEqual(count_arrangements([4]), 0)
+        self.assertEqual(count_arrangements([]), 1)
+
+    def test_long_chain(self):
+        # with every rating from 1 to n the counts follow the tribonacci numbers, far deeper than recursion allows
+        adapters = list(range(1, 100_001))
+        ways = count_arrangements(adapters)
+
+        self.assertEqual(ways % 1_000_000_007, tribonacci_mod(100_000, 1_000_000_007))
+
+    def test_repeated_adapter(self):
+        with self.assertRaises(ValueError):
+            count_arrangements([1, 2, 2, 3])
+
+
+class TestChainStats(TestCase):
+
+    def test_counting_sort(self):
+        rng = random.Random(47)
+        ratings = [rng.randrange(200) for _ in range(500)]
+
+        self.assertEqual(counting_sort(ratings), sorted(ratings))
+        self.assertEqual(counting_sort([]), [])
+
+        with self.assertRaises(ValueError):
+            counting_sort([3, -1, 2])
+
+    def test_examples(self):
+        differences, arrangements = chain_stats(sorted(small))
+        self.assertEqual((differences[1], differences[3], arrangements), (7, 5, 8))
+
+        differences, arrangements = chain_stats(sorted(large))
+        self.assertEqual((differences[1], differences[3], arrangements), (22, 10, 19208))
+
+
+class TestConfigurableArrangements(TestCase):
+
+    def brute_force(self, adapters, max_gap):
+        count = 0
+        for size in range(len(adapters)+1):
+            for chain in combinations(adapters, size):
+                ratings = [0, *chain, adapters[-1]+max_gap]
+                count += all(b - a <= max_gap for a, b in zip(ratings, ratings[1:]))
+        return count
+
+    def test_matches_brute_force(self):
+        rng = random.Random(48)
+        for _ in range(100):
+            max_gap = rng.randrange(1, 6)
+            adapters = sorted(rng.sample(range(1, 30), rng.randrange(1, 12)))
+            expected = self.brute_force(adapters, max_gap)
+
+            self.assertEqual(count_arrangements(adapters, max_gap=max_gap), expected, (adapters, max_gap))
+            self.assertEqual(count_arrangements(adapters, max_gap=max_gap, modulus=7), expected % 7)
+
+    def test_modulus_matches_exact(self):
+        adapters = sorted(large)
+
+        self.assertEqual(count_arrangements(adapters, modulus=1_000), 19208 % 1_000)
+
+        adapters = list(range(1, 5_001))
+        self.assertEqual(
+            count_arrangements(adapters, modulus=1_000_000_007),
+            count_arrangements(adapters) % 1_000_000_007
+        )
+
+    def test_no_adapters(self):
+        self.assertEqual(count_arrangements([]), 1)
+        self.assertEqual(count_arrangements([], modulus=1), 0)
+
+    def test_bad_max_gap(self):
+        with self.assertRaises(ValueError):
+            chain_stats([1, 2], max_gap=0)
+        with self.assertRaises(ValueError):
+            count_arrangements([1, 2, 3], modulus=0)
+        with self.assertRaises(ValueError):
+            count_arrangements([1, 2, 3], modulus=-7)
+
+    def test_max_gap_differences(self):
+        differences, _ = chain_stats([2, 4, 9], max_gap=5)
+
+        self.assertEqual(differences, {2: 2, 5: 2})
+
+
+def tribonacci_mod(n, modulus):
+    a, b, c = 0, 0, 1
+    for _ in range(n):
+        a, b, c = b, c, (a + b + c) % modulus
+    return c
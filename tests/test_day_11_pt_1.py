@@ -0,0 +1,34 @@
+from unittest import TestCase
+
+import numpy as np
+
+from days.day_11.pt_1.app import create_grid, simulate, update_grid, update_layout
+
+example = """L.LL.LL.LL
+LLLLLLL.LL
+L.L.L..L..
+LLLL.LL.LL
+L.LL.LL.LL
+L.LLLLL.LL
+..L.L.....
+LLLLLLLLLL
+L.LLLLLL.L
+L.LLLLL.LL""".splitlines()
+
+
+class TestSimulate(TestCase):
+
+    def test_example(self):
+        self.assertEqual(simulate(example), 37)
+
+    def test_matches_update_layout(self):
+        layout = example
+        seats, occupied = create_grid(layout)
+        shape = len(layout), len(layout[0])
+
+        for _ in range(6):
+            layout, _ = update_layout(layout, shape=shape)
+            occupied = update_grid(seats, occupied)
+
+            _, expected = create_grid(layout)
+            np.testing.assert_array_equal(occupied, expected)
@@ -0,0 +1,70 @@
+import random
+from unittest import TestCase
+
+import numpy as np
+
+from days.day_11.pt_2.app import (
+    create_grid,
+    directions,
+    simulate,
+    update_layout,
+    update_seats,
+    visible_neighbours,
+)
+
+example = """L.LL.LL.LL
+LLLLLLL.LL
+L.L.L..L..
+LLLL.LL.LL
+L.LL.LL.LL
+L.LLLLL.LL
+..L.L.....
+LLLLLLLLLL
+L.LLLLLL.L
+L.LLLLL.LL""".splitlines()
+
+
+def walk_to_seat(layout, row, col, direction):
+    while True:
+        row, col = row + direction[0], col + direction[1]
+        if not (0 <= row < len(layout) and 0 <= col < len(layout[0])):
+            return None
+        if layout[row][col] != ".":
+            return row, col
+
+
+class TestVisibleNeighbours(TestCase):
+
+    def test_matches_walking(self):
+        rng = random.Random(50)
+        for _ in range(20):
+            rows, cols = rng.randrange(1, 12), rng.randrange(1, 12)
+            layout = ["".join(rng.choice("L.") for _ in range(cols)) for _ in range(rows)]
+            seats, _ = create_grid(layout)
+            coords = list(zip(*np.nonzero(seats)))
+
+            neighbours = visible_neighbours(seats)
+            self.assertEqual(neighbours.shape, (len(coords), 8))
+            self.assertEqual(neighbours.dtype, np.int32)
+
+            for seat, (row, col) in enumerate(coords):
+                expected = [walk_to_seat(layout, row, col, d) for d in directions]
+                found = [None if idx == -1 else tuple(coords[idx]) for idx in neighbours[seat]]
+                self.assertEqual(found, expected)
+
+    def test_example(self):
+        self.assertEqual(simulate(example), 26)
+
+    def test_matches_update_layout(self):
+        layout = example
+        seats, occupied = create_grid(layout)
+        neighbours = visible_neighbours(seats)
+        occupied = occupied[seats]
+        shape = len(layout), len(layout[0])
+
+        for _ in range(6):
+            layout, _ = update_layout(layout, shape=shape)
+            occupied = update_seats(occupied, neighbours)
+
+            _, expected = create_grid(layout)
+            np.testing.assert_array_equal(occupied, expected[seats])
@@ -0,0 +1,54 @@
+from itertools import product
+from unittest import TestCase
+
+from days.day_5.pt_1.app import (
+    Direction,
+    calc_seat,
+    decode_seat,
+    decode_seats,
+    n_cols,
+    n_rows,
+    splitter,
+)
+
+
+class TestSeatDecoding(TestCase):
+
+    passes = ["".join(p) for p in product("FB", "FB", "FB", "FB", "FB", "FB", "FB", "LR", "LR", "LR")]
+
+    def test_examples(self):
+        examples = {
+            "FBFBBFFRLR": 357,
+            "BFFFBBFRRR": 567,
+            "FFFBBBFRRR": 119,
+            "BBFFBBFRLL": 820,
+        }
+
+        for pass_, seat_id in examples.items():
+            self.assertEqual(decode_seat(pass_), seat_id)
+            self.assertEqual(calc_seat(pass_), seat_id)
+
+    def test_decode_seat_matches_splitter(self):
+        for pass_ in self.passes:
+            row = splitter((Direction(char) for char in pass_[:7]), n_rows)
+            col = splitter((Direction(char) for char in pass_[7:]), n_cols)
+
+            self.assertEqual(decode_seat(pass_), 8*row+col)
+
+    def test_decode_seats_matches_decode_seat(self):
+        self.assertEqual(
+            decode_seats(self.passes).tolist(),
+            [decode_seat(pass_) for pass_ in self.passes]
+        )
+
+    def test_decode_seats_rejects_bad_passes(self):
+        bad_inputs = [
+            ["FBFBBFFRLR\r"] * 10,
+            ["FBFBBFFRLR ", "FBFBBFFRL"],
+            ["FBFBBFFRLX"],
+            ["FBFBBFFRLr"],
+        ]
+
+        for bad in bad_inputs:
+            with self.assertRaises(ValueError, msg=bad):
+                decode_seats(bad)
@@ -0,0 +1,108 @@
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+import numpy as np
+
+from days.day_5.pt_2.app import (
+    Layout,
+    build_seat_index,
+    decode_manifest,
+    decode_seat,
+    decode_seats,
+    default_layout,
+    find_missing_seats,
+    free_seats,
+    load_seat_index,
+    occupied_seats,
+    save_seat_index,
+)
+
+
+class TestFindMissingSeats(TestCase):
+
+    def test_single_gap(self):
+        self.assertEqual(find_missing_seats([5, 3, 7, 4, 8]), [6])
+
+    def test_every_gap_is_reported(self):
+        self.assertEqual(find_missing_seats([10, 14, 11, 17]), [12, 13, 15, 16])
+
+    def test_front_and_back_are_not_gaps(self):
+        self.assertEqual(find_missing_seats([0, 1, 2]), [])
+        self.assertEqual(find_missing_seats([1021, 1023], rows=range(128), cols=range(8)), [1022])
+        self.assertEqual(find_missing_seats([]), [])
+
+    def test_plane_size(self):
+        self.assertEqual(find_missing_seats([0, 2, 3], rows=range(2), cols=range(2)), [1])
+
+        with self.assertRaises(ValueError):
+            find_missing_seats([4], rows=range(2), cols=range(2))
+        with self.assertRaises(ValueError):
+            find_missing_seats([-1, 1020])
+
+
+class TestLayouts(TestCase):
+
+    def test_default_layout(self):
+        self.assertEqual(default_layout.n_bits, 10)
+        self.assertEqual(decode_seat("FBFBBFFRLR"), 357)
+
+    def test_decode_seats_with_layout(self):
+        layout = Layout(row_bits=4, col_bits=2, lower="DW", upper="UE")
+
+        self.assertEqual(decode_seats(["DUDUWE", "UUUUEE"], layout=layout).tolist(), [21, 63])
+
+    def test_decode_manifest(self):
+        small = Layout(row_bits=5, col_bits=2)
+        seats = decode_manifest(["FBFBBFFRLR", "BBBFFLR", "FFFFFLL"], layouts=[default_layout, small])
+
+        self.assertEqual(seats.typecode, "I")
+        self.assertEqual(seats.tolist(), [357, 113, 0])
+
+    def test_decode_manifest_errors(self):
+        with self.assertRaises(ValueError):
+            decode_manifest(["FBFBBFFRLR"], layouts=[default_layout, Layout(row_bits=6, col_bits=4)])
+
+        with self.assertRaises(ValueError):
+            decode_manifest(["FBF"], layouts=[default_layout])
+
+    def test_decode_seats_rejects_bad_passes(self):
+        layout = Layout(row_bits=4, col_bits=2, lower="DW", upper="UE")
+
+        with self.assertRaises(ValueError):
+            decode_seats(["DUDUWF"], layout=layout)
+        with self.assertRaises(ValueError):
+            decode_seats(["FBFBBFFRLR\r"])
+        with self.assertRaises(ValueError):
+            decode_seats(["FBFBBFFRLRF", "FBFBBFFRL"])
+
+
+class TestSeatIndex(TestCase):
+
+    def test_build_seat_index(self):
+        index = build_seat_index([357, 8, 567])
+
+        self.assertEqual(index["id"].tolist(), [8, 357, 567])
+        self.assertEqual(index["row"].tolist(), [1, 44, 70])
+        self.assertEqual(index["col"].tolist(), [0, 5, 7])
+
+    def test_save_and_load(self):
+        index = build_seat_index([357, 8, 567, 9, 1023])
+
+        with TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "seat_index.npy")
+            save_seat_index(index, path)
+            loaded = load_seat_index(path)
+
+            self.assertIsInstance(loaded, np.memmap)
+            np.testing.assert_array_equal(loaded, index)
+            self.assertEqual(occupied_seats(loaded, 1, 45)["id"].tolist(), [8, 9, 357])
+            del loaded
+
+    def test_queries(self):
+        layout = Layout(row_bits=2, col_bits=1)
+        index = build_seat_index([0, 3, 4, 5], layout=layout)
+
+        self.assertEqual(occupied_seats(index, 1, 3)["id"].tolist(), [3, 4, 5])
+        self.assertEqual(occupied_seats(index, 3, 4)["id"].tolist(), [])
+        self.assertEqual(free_seats(index, layout=layout).tolist(), [1, 2, 6, 7])
@@ -0,0 +1,27 @@
+import io
+from unittest import TestCase
+
+from days.day_6.pt_1.app import count_yaaaases, stream_groups
+
+
+class TestStreamGroups(TestCase):
+
+    def test_file_handle(self):
+        handle = io.StringIO("abc\n\na\nb\nc\n\nab\nac\n\na\na\na\na\n\nb\n")
+
+        self.assertEqual(
+            list(stream_groups(handle)),
+            [(0, 3, 3), (1, 3, 0), (2, 3, 1), (3, 1, 1), (4, 1, 1)]
+        )
+
+    def test_last_group(self):
+        self.assertEqual(list(stream_groups(["ab", "", "b"])), [(0, 2, 2), (1, 1, 1)])
+        self.assertEqual(list(stream_groups(["", "ab", "", "", "b", ""])), [(0, 2, 2), (1, 1, 1)])
+
+    def test_is_lazy(self):
+        groups = stream_groups(iter(["ab", "", "b", ""]))
+
+        self.assertEqual(next(groups), (0, 2, 2))
+
+    def test_count_yaaaases(self):
+        self.assertEqual(sum(count_yaaaases("abc\n\na\nb\nc".splitlines())), 6)
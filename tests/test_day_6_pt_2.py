@@ -0,0 +1,62 @@
+from unittest import TestCase
+
+from days.day_6.pt_2.app import answer_mask, answer_masks, count_answers, count_groups
+
+example = """abc
+
+a
+b
+c
+
+ab
+ac
+
+a
+a
+a
+a
+
+b"""
+
+
+class TestCountAnswers(TestCase):
+
+    def test_answer_mask(self):
+        self.assertEqual(answer_mask("a"), 1)
+        self.assertEqual(answer_mask("cab"), 0b111)
+        self.assertEqual(answer_mask("z"), 1 << 25)
+
+    def test_example(self):
+        self.assertEqual(count_answers(example.splitlines()), (11, 6))
+
+    def test_example_vectorised(self):
+        masks, group_offsets = answer_masks(example)
+        any_counts, all_counts = count_groups(masks, group_offsets)
+
+        self.assertEqual(group_offsets.tolist(), [0, 1, 4, 6, 10])
+        self.assertEqual(any_counts.tolist(), [3, 3, 3, 1, 1])
+        self.assertEqual(all_counts.tolist(), [3, 0, 1, 1, 1])
+
+    def test_blank_lines_vectorised(self):
+        masks, group_offsets = answer_masks("\nab\n\n\nb\n")
+        any_counts, all_counts = count_groups(masks, group_offsets)
+
+        self.assertEqual(masks.tolist(), [0b11, 0b10])
+        self.assertEqual(group_offsets.tolist(), [0, 1])
+        self.assertEqual((any_counts.tolist(), all_counts.tolist()), ([2, 1], [2, 1]))
+        self.assertEqual([a.tolist() for a in count_groups(*answer_masks(""))], [[], []])
+
+    def test_crlf_vectorised(self):
+        masks, group_offsets = answer_masks(example.replace("\n", "\r\n"))
+        any_counts, all_counts = count_groups(masks, group_offsets)
+
+        self.assertEqual((any_counts.sum(), all_counts.sum()), (11, 6))
+
+    def test_bad_answers_vectorised(self):
+        for input_ in ("ab\nAb", "a b", "ab\rb", "ab\n\n{"):
+            with self.assertRaises(ValueError):
+                answer_masks(input_)
+
+    def test_blank_lines(self):
+        self.assertEqual(count_answers(["", "ab", "", "", "b", ""]), (3, 3))
+        self.assertEqual(count_answers([]), (0, 0))
@@ -0,0 +1,78 @@
+from unittest import TestCase
+
+from days.day_7.pt_1.app import ancestor_counts, ancestor_sets, build_graph, find_ancestors, topological_order
+
+example = """light red bags contain 1 bright white bag, 2 muted yellow bags.
+dark orange bags contain 3 bright white bags, 4 muted yellow bags.
+bright white bags contain 1 shiny gold bag.
+muted yellow bags contain 2 shiny gold bags, 9 faded blue bags.
+shiny gold bags contain 1 dark olive bag, 2 vibrant plum bags.
+dark olive bags contain 3 faded blue bags, 4 dotted black bags.
+vibrant plum bags contain 5 faded blue bags, 6 dotted black bags.
+faded blue bags contain no other bags.
+dotted black bags contain no other bags."""
+
+
+class TestBagGraph(TestCase):
+
+    def setUp(self):
+        self.graph = build_graph(example.splitlines())
+
+    def children(self, color):
+        graph = self.graph
+        node = graph.ids[color]
+        start, end = graph.offsets[node], graph.offsets[node+1]
+
+        return {graph.colors[t]: w for t, w in zip(graph.targets[start:end], graph.weights[start:end])}
+
+    def parents(self, color):
+        graph = self.graph
+        node = graph.ids[color]
+        start, end = graph.parent_offsets[node], graph.parent_offsets[node+1]
+
+        return {graph.colors[p]: w for p, w in zip(graph.parents[start:end], graph.parent_weights[start:end])}
+
+    def test_interning(self):
+        self.assertEqual(len(self.graph), 9)
+        self.assertEqual(self.graph.colors[self.graph.ids["shiny gold"]], "shiny gold")
+
+    def test_edges(self):
+        self.assertEqual(self.children("muted yellow"), {"shiny gold": 2, "faded blue": 9})
+        self.assertEqual(self.children("faded blue"), {})
+        self.assertEqual(self.parents("shiny gold"), {"bright white": 1, "muted yellow": 2})
+        self.assertEqual(self.parents("light red"), {})
+
+    def test_find_ancestors(self):
+        ancestors = find_ancestors(self.graph, self.graph.ids["shiny gold"])
+
+        self.assertEqual(
+            {self.graph.colors[a] for a in ancestors},
+            {"bright white", "muted yellow", "dark orange", "light red"}
+        )
+
+    def test_ancestor_counts(self):
+        counts = ancestor_counts(self.graph)
+
+        for color, node in self.graph.ids.items():
+            self.assertEqual(counts[node], len(find_ancestors(self.graph, node)), color)
+        self.assertEqual(counts[self.graph.ids["shiny gold"]], 4)
+        self.assertEqual(ancestor_sets(self.graph)[self.graph.ids["light red"]], 0)
+
+    def test_shared_ancestors(self):
+        # every layer can be held by both bags of the layer above, which blew up the recursive walk
+        lines = []
+        for layer in range(1, 61):
+            for side in ("left", "right"):
+                lines.append(f"{side} {'x'*layer} bags contain 1 left {'x'*(layer+1)} bag, 1 right {'x'*(layer+1)} bag.")
+        graph = build_graph(lines)
+
+        self.assertEqual(ancestor_counts(graph)[graph.ids["left " + "x"*61]], 120)
+
+    def test_cycle(self):
+        graph = build_graph([
+            "light red bags contain 1 bright white bag.",
+            "bright white bags contain 2 light red bags.",
+        ])
+
+        with self.assertRaises(ValueError):
+            topological_order(graph)
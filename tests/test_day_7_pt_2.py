@@ -0,0 +1,95 @@
+from unittest import TestCase
+
+from days.day_7.pt_2.app import BagRules, build_graph, contained_counts
+
+example = """shiny gold bags contain 2 dark red bags.
+dark red bags contain 2 dark orange bags.
+dark orange bags contain 2 dark yellow bags.
+dark yellow bags contain 2 dark green bags.
+dark green bags contain 2 dark blue bags.
+dark blue bags contain 2 dark violet bags.
+dark violet bags contain no other bags."""
+
+
+class TestContainedCounts(TestCase):
+
+    def test_example(self):
+        graph = build_graph(example.splitlines())
+        counts = contained_counts(graph)
+
+        self.assertEqual(counts[graph.ids["shiny gold"]], 126)
+        self.assertEqual(counts[graph.ids["dark violet"]], 0)
+
+    def test_deep_chain(self):
+        # far deeper than the recursion limit, and the total needs more than 64 bits
+        lines = [f"bag {'x'*i} bags contain 3 bag {'x'*(i+1)} bags." for i in range(1, 2001)]
+        graph = build_graph(lines)
+
+        self.assertEqual(contained_counts(graph)[graph.ids["bag x"]], (3**2001 - 3) // 2)
+
+    def test_cycle(self):
+        graph = build_graph([
+            "light red bags contain 1 bright white bag.",
+            "bright white bags contain 2 light red bags.",
+        ])
+
+        with self.assertRaises(ValueError):
+            contained_counts(graph)
+
+
+class TestBagRules(TestCase):
+
+    def setUp(self):
+        self.rules = BagRules(example.splitlines())
+
+    def test_queries(self):
+        self.assertEqual(self.rules.count("shiny gold"), 126)
+        self.assertEqual(self.rules.count("dark violet"), 0)
+        self.assertEqual(self.rules.ancestors("dark orange"), {"shiny gold", "dark red"})
+        self.assertEqual(self.rules.ancestors("shiny gold"), set())
+
+    def test_unknown_color(self):
+        rules = BagRules(["shiny gold bags contain 2 dark red bags."])
+
+        with self.assertRaises(KeyError):
+            rules.count("nonexistent")
+        with self.assertRaises(KeyError):
+            rules.ancestors("nonexistent")
+        self.assertEqual(rules.count("dark red"), 0)
+        self.assertEqual(rules.ancestors("dark red"), {"shiny gold"})
+        self.assertEqual(repr(rules), "BagRules(colors=2)")
+
+    def test_add_rule(self):
+        self.assertEqual(self.rules.count("shiny gold"), 126)
+        self.assertEqual(self.rules.ancestors("dark violet"), {c for c in self.rules._children if c != "dark violet"})
+
+        self.rules.add_rule("dark blue bags contain 3 dark violet bags, 1 faded blue bag.")
+        self.rules.add_rule("light red bags contain 1 shiny gold bag.")
+
+        self.assertEqual(self.rules.count("dark blue"), 4)
+        self.assertEqual(self.rules.count("shiny gold"), 190)
+        self.assertEqual(self.rules.count("light red"), 191)
+        self.assertEqual(self.rules.ancestors("faded blue"), self.rules.ancestors("dark blue") | {"dark blue"})
+        self.assertIn("light red", self.rules.ancestors("dark violet"))
+
+    def test_remove_rule(self):
+        self.assertEqual(self.rules.count("shiny gold"), 126)
+        self.assertIn("shiny gold", self.rules.ancestors("dark violet"))
+
+        self.rules.remove_rule("dark orange")
+
+        self.assertEqual(self.rules.count("shiny gold"), 6)
+        self.assertEqual(self.rules.count("dark yellow"), 14)
+        self.assertEqual(self.rules.ancestors("dark violet"), {"dark yellow", "dark green", "dark blue"})
+
+    def test_only_ancestors_are_invalidated(self):
+        self.rules.count("shiny gold")
+        self.rules.add_rule("dark green bags contain 1 dark blue bag.")
+
+        self.assertEqual(set(self.rules._counts), {"dark blue", "dark violet"})
+
+    def test_cycle(self):
+        self.rules.add_rule("dark violet bags contain 1 shiny gold bag.")
+
+        with self.assertRaises(ValueError):
+            self.rules.count("dark red")
@@ -0,0 +1,119 @@
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from days.day_8.vm import InstructionEnum, load_bytecode, save_bytecode
+from days.day_8.pt_2.app import VM, Status, create_instructions, parallel_repair
+
+example = """nop +0
+acc +1
+jmp +4
+acc +3
+jmp -3
+acc -99
+acc +1
+jmp -4
+acc +6"""
+
+
+class TestVM(TestCase):
+
+    def setUp(self):
+        self.instructions = create_instructions(example.splitlines())
+
+    def test_looped(self):
+        result = VM(self.instructions).run()
+
+        self.assertEqual(result.status, Status.looped)
+        self.assertEqual(result.acc, 5)
+        self.assertEqual(result.idx, 1)
+
+    def test_flip_candidates(self):
+        vm = VM(self.instructions)
+
+        self.assertEqual(list(vm.flip_candidates()), [0, 2, 4, 7])
+        vm.flip(7)
+        self.assertEqual(list(vm.flip_candidates()), [0, 2, 4, 7])
+
+    def test_flip_terminates(self):
+        vm = VM(self.instructions)
+        vm.flip(7)
+        result = vm.run()
+
+        self.assertEqual(result.status, Status.terminated)
+        self.assertEqual(result.acc, 8)
+
+        vm.flip(7)
+        self.assertEqual(vm.run().status, Status.looped)
+
+    def test_out_of_bounds(self):
+        result = VM(create_instructions(["acc +2", "jmp -5"])).run()
+
+        self.assertEqual(result.status, Status.out_of_bounds)
+        self.assertEqual((result.acc, result.idx), (2, -4))
+
+    def test_repair(self):
+        idx, result = VM(self.instructions).repair()
+
+        self.assertEqual(idx, 7)
+        self.assertEqual(result.status, Status.terminated)
+        self.assertEqual(result.acc, 8)
+
+    def test_repair_long_program(self):
+        # a long run of nops with a jmp back to the first one at the very end
+        n_nops = 50_000
+        lines = ["acc +1"] + ["nop +0"] * n_nops + [f"jmp -{n_nops}"]
+        vm = VM(create_instructions(lines))
+
+        idx, result = vm.repair()
+        self.assertEqual(idx, n_nops + 1)
+        self.assertEqual((result.status, result.acc), (Status.terminated, 1))
+
+    def test_repair_already_terminates(self):
+        # flipping the nop at 0 into a jmp +0 would loop, so there is nothing to repair
+        vm = VM(create_instructions(["nop +0", "acc +1", "jmp +1"]))
+
+        self.assertIsNone(vm.repair())
+        self.assertEqual(vm.run().status, Status.terminated)
+
+        vm = VM(self.instructions)
+        vm.flip(7)
+        self.assertIsNone(vm.repair())
+
+    def test_nothing_to_repair(self):
+        self.assertIsNone(VM(create_instructions(["jmp +1", "jmp -1", "jmp +5"])).repair())
+
+    def test_parallel_repair(self):
+        idx, result = parallel_repair(VM(self.instructions), processes=2, chunksize=1)
+
+        self.assertEqual(idx, 7)
+        self.assertEqual((result.status, result.acc), (Status.terminated, 8))
+        self.assertIsNone(parallel_repair(VM(create_instructions(["jmp +1", "jmp -1", "jmp +5"])), processes=2))
+
+    def test_parallel_repair_bytecode(self):
+        # spawned workers only get the VM by pickling it, views onto the mapping and all
+        with TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "example.hgc")
+            save_bytecode(VM(self.instructions), path)
+            vm = load_bytecode(path)
+            idx, result = parallel_repair(vm, processes=2, chunksize=1, start_method="spawn")
+            del vm
+
+        self.assertEqual(idx, 7)
+        self.assertEqual((result.status, result.acc), (Status.terminated, 8))
+
+    def test_trace(self):
+        vm = VM(self.instructions)
+        result, trace = vm.trace()
+
+        self.assertEqual(result, vm.run())
+        self.assertEqual(trace.steps.tolist(), [0, 1, 2, 6, 7, 3, 4])
+        self.assertEqual(trace.opcode_counts, {InstructionEnum.acc: 3, InstructionEnum.jmp: 3, InstructionEnum.nop: 1})
+        self.assertEqual((trace.loop_start, trace.cycle_length), (1, 6))
+
+        vm.flip(7)
+        result, trace = vm.trace()
+
+        self.assertEqual(result.status, Status.terminated)
+        self.assertEqual(trace.steps.tolist(), [0, 1, 2, 6, 7, 8])
+        self.assertEqual((trace.loop_start, trace.cycle_length), (None, None))
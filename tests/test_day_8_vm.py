@@ -0,0 +1,109 @@
+import os
+import pickle
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from days.day_8.vm import (
+    VM,
+    Status,
+    create_instructions,
+    load_bytecode,
+    opcode_registry,
+    opcode_steps,
+    register_opcode,
+    save_bytecode,
+)
+
+example = """nop +0
+acc +1
+jmp +4
+acc +3
+jmp -3
+acc -99
+acc +1
+jmp -4
+acc +6"""
+
+
+class TestBytecode(TestCase):
+
+    def setUp(self):
+        self.vm = VM(create_instructions(example.splitlines()))
+
+    def test_round_trip(self):
+        loaded = VM.from_bytecode(self.vm.to_bytecode())
+
+        self.assertEqual(len(loaded), 9)
+        self.assertEqual(loaded.run(), self.vm.run())
+        self.assertEqual(loaded.trace(), self.vm.trace())
+
+    def test_repair_read_only_bytecode(self):
+        loaded = VM.from_bytecode(self.vm.to_bytecode())
+        idx, result = loaded.repair()
+
+        self.assertEqual(idx, 7)
+        self.assertEqual((result.status, result.acc), (Status.terminated, 8))
+        self.assertEqual(loaded.run(), self.vm.run())
+
+    def test_pickle_bytecode(self):
+        with TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "example.hgc")
+            save_bytecode(self.vm, path)
+            loaded = load_bytecode(path)
+            unpickled = pickle.loads(pickle.dumps(loaded))
+            del loaded
+
+        self.assertEqual(len(unpickled), 9)
+        self.assertEqual(unpickled.run(), self.vm.run())
+        self.assertEqual(unpickled.repair(), self.vm.repair())
+
+    def test_load_bytecode(self):
+        with TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "example.hgc")
+            save_bytecode(self.vm, path)
+            loaded = load_bytecode(path)
+
+            loaded.flip(7)
+            result = loaded.run()
+            self.assertEqual((result.status, result.acc), (Status.terminated, 8))
+
+            # flipping only touched the private mapping
+            self.assertEqual(load_bytecode(path).run(), self.vm.run())
+            self.assertEqual(loaded.repair(), None)
+            del loaded
+
+    def test_bad_bytecode(self):
+        bytecode = self.vm.to_bytecode()
+
+        with self.assertRaises(ValueError):
+            VM.from_bytecode(b"XXXX" + bytecode[4:])
+        with self.assertRaises(ValueError):
+            VM.from_bytecode(bytecode[:-1])
+
+        corrupt = bytearray(bytecode)
+        corrupt[8] = 255
+        with self.assertRaises(ValueError):
+            VM.from_bytecode(corrupt)
+
+
+class TestOpcodeRegistry(TestCase):
+
+    def tearDown(self):
+        if "dbl" in opcode_registry:
+            del opcode_registry["dbl"]
+            opcode_steps.pop()
+
+    def test_custom_opcode(self):
+        register_opcode("dbl", lambda acc, idx, value: (acc * value, idx + 1))
+        vm = VM(create_instructions(["acc +3", "dbl +4", "jmp +1"]))
+
+        self.assertEqual(vm.run().acc, 12)
+        self.assertEqual(vm.trace()[1].opcode_counts["dbl"], 1)
+        self.assertEqual(VM.from_bytecode(vm.to_bytecode()).run().acc, 12)
+
+        with self.assertRaises(ValueError):
+            register_opcode("dbl", lambda acc, idx, value: (acc, idx + 1))
+
+    def test_unknown_instruction(self):
+        with self.assertRaises(ValueError):
+            create_instructions(["xyz +1"])
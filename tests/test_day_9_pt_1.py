@@ -0,0 +1,96 @@
+import io
+import random
+from unittest import TestCase
+
+import numpy as np
+
+from days.day_9.pt_1.app import Checkpoint, Program, invalid_mask, load_numbers, read_numbers
+
+example = [
+    35, 20, 15, 25, 47, 40, 62, 55, 65, 95, 102, 117, 150, 182, 127, 219, 299, 277, 309, 576
+]
+
+
+def calc_sums(preamble):
+    return {a + b for idx, a in enumerate(preamble) for b in preamble[idx+1:] if a != b}
+
+
+class TestProgram(TestCase):
+
+    def test_example(self):
+        self.assertEqual(Program(example, preamble_length=5).run(), 127)
+
+    def test_all_valid(self):
+        self.assertIsNone(Program(example[:14], preamble_length=5).run())
+
+    def test_repeated_numbers(self):
+        # a number can't be summed with itself, even if it's in the preamble twice
+        self.assertEqual(Program([5, 5, 1, 10], preamble_length=3).run(), 10)
+        self.assertIsNone(Program([5, 5, 1, 6], preamble_length=3).run())
+
+    def test_matches_pair_sums(self):
+        rng = random.Random(9)
+        numbers = [rng.randrange(50) for _ in range(2000)]
+
+        expected = None
+        for idx in range(25, len(numbers)):
+            if numbers[idx] not in calc_sums(numbers[idx-25:idx]):
+                expected = numbers[idx]
+                break
+
+        self.assertEqual(Program(numbers, preamble_length=25).run(), expected)
+
+    def test_large_preamble(self):
+        numbers = list(range(1, 1001)) + [1999, 2000]
+
+        self.assertEqual(Program(numbers, preamble_length=1000).run(), 2000)
+
+
+class TestStreaming(TestCase):
+
+    def test_every_invalid_number(self):
+        numbers = example + [1, 2000, 885]
+
+        self.assertEqual(
+            list(Program(numbers, preamble_length=5).invalid_numbers()),
+            [(14, 127), (20, 1), (21, 2000)]
+        )
+
+    def test_read_numbers(self):
+        handle = io.StringIO("\n".join(str(n) for n in example) + "\n")
+
+        self.assertEqual(list(Program(read_numbers(handle), preamble_length=5).invalid_numbers()), [(14, 127)])
+
+    def test_resume_from_checkpoint(self):
+        numbers = example + [1, 2000, 885]
+        stream = iter(numbers)
+        program = Program(stream, preamble_length=5)
+        invalid = program.invalid_numbers()
+
+        self.assertEqual(next(invalid), (14, 127))
+        checkpoint = program.checkpoint()
+        self.assertEqual(checkpoint, Checkpoint(position=15, preamble=[102, 117, 150, 182, 127]))
+
+        resumed = Program.resume(checkpoint, stream)
+        self.assertEqual(list(resumed.invalid_numbers()), [(20, 1), (21, 2000)])
+
+
+class TestInvalidMask(TestCase):
+
+    def test_example(self):
+        numbers = load_numbers("\n".join(str(n) for n in example + [1, 2000, 885]))
+        mask = invalid_mask(numbers, preamble_length=5)
+
+        self.assertEqual(np.flatnonzero(mask).tolist(), [14, 20, 21])
+
+    def test_matches_streaming(self):
+        rng = random.Random(45)
+        numbers = [rng.randrange(60) for _ in range(3000)]
+        expected = [position for position, _ in Program(numbers, preamble_length=25).invalid_numbers()]
+
+        for max_pair_sums in (1, 1000, 1 << 22):
+            mask = invalid_mask(np.array(numbers, dtype=np.int64), preamble_length=25, max_pair_sums=max_pair_sums)
+            self.assertEqual(np.flatnonzero(mask).tolist(), expected)
+
+    def test_short_input(self):
+        self.assertFalse(invalid_mask(np.array([1, 2, 3], dtype=np.int64), preamble_length=5).any())
@@ -0,0 +1,58 @@
+import random
+from unittest import TestCase
+
+from days.day_9.pt_2.app import (
+    find_contiguous_range,
+    find_range_prefix_sums,
+    find_range_two_pointer,
+)
+
+example = [
+    35, 20, 15, 25, 47, 40, 62, 55, 65, 95, 102, 117, 150, 182, 127, 219, 299, 277, 309, 576
+]
+
+
+def brute_force(numbers, target):
+    # every range of two or more numbers that sums to target
+    return {
+        (start, start+length)
+        for length in range(2, len(numbers)+1)
+        for start in range(len(numbers)-length+1)
+        if sum(numbers[start:start+length]) == target
+    }
+
+
+class TestFindContiguousRange(TestCase):
+
+    def test_example(self):
+        found = find_contiguous_range(example, 127)
+
+        self.assertEqual((found.start, found.stop), (2, 6))
+        self.assertEqual(found.smallest + found.largest, 62)
+
+    def test_single_number_is_not_a_range(self):
+        self.assertIsNone(find_range_two_pointer([1, 127, 1], 127))
+        self.assertIsNone(find_range_prefix_sums([1, 127, 1], 127))
+        self.assertEqual(find_range_two_pointer([127, 0], 127).stop, 2)
+
+    def test_matches_brute_force(self):
+        rng = random.Random(43)
+        for _ in range(200):
+            for finder, low in ((find_range_two_pointer, 0), (find_range_prefix_sums, -20)):
+                numbers = [rng.randrange(low, 20) for _ in range(rng.randrange(2, 30))]
+                target = rng.randrange(0, 60)
+                found = finder(numbers, target)
+                expected = brute_force(numbers, target)
+
+                if not expected:
+                    self.assertIsNone(found)
+                    continue
+
+                self.assertIn((found.start, found.stop), expected)
+                contiguous = numbers[found.start:found.stop]
+                self.assertEqual((found.smallest, found.largest), (min(contiguous), max(contiguous)))
+
+    def test_negative_numbers_use_prefix_sums(self):
+        found = find_contiguous_range([5, -3, 10, 1], 7)
+
+        self.assertEqual((found.start, found.stop, found.smallest, found.largest), (1, 3, -3, 10))